@@ -6,9 +6,6 @@ import sys
 
 import click
 
-from src.config import TestConfig
-from src.orchestrator import TestOrchestrator
-
 
 @click.command()
 @click.option(
@@ -47,6 +44,11 @@ def main(mode: str, suite: str, base_url: str | None, timeout: int | None, verbo
     click.echo(f"   Suite: {suite}")
     click.echo()
 
+    # Deferred so that --help, --version and argument errors don't pay for
+    # importing the test tooling
+    from src.config import TestConfig
+    from src.orchestrator import TestOrchestrator
+
     # Load configuration
     config = TestConfig.from_mode(mode)
     
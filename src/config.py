@@ -3,47 +3,48 @@ Configuration management for test runner.
 """
 
 import os
+from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel, Field
+# Services covered by the test suites
+_DEFAULT_SERVICES: tuple[str, ...] = (
+    "access",
+    "audit",
+    "catalog",
+    "customers",
+    "inventory",
+    "orders",
+    "pricing",
+    "sales-dashboard",
+    "sites",
+    "chatbot",
+    "recommender",
+    "auth-b2c",
+    "auth-b2e",
+)
 
 
-class TestConfig(BaseModel):
+@dataclass(slots=True)
+class TestConfig:
     """Test configuration based on execution mode."""
 
     mode: Literal["pr", "staging"]
     base_url: str
-    timeout: int = Field(default=60, description="Default timeout in seconds")
-    verbose: bool = Field(default=False, description="Enable verbose logging")
-    
+    timeout: int = 60  # Default timeout in seconds
+    verbose: bool = False  # Enable verbose logging
+
     # GitHub integration
-    github_token: str | None = Field(default=None, description="GitHub token for API access")
-    github_repo: str = Field(default="Shopifake/shopifake-back", description="GitHub repository")
-    github_commit_sha: str | None = Field(default=None, description="Git commit SHA for result posting")
-    
+    github_token: str | None = None  # GitHub token for API access
+    github_repo: str = "Shopifake/shopifake-back"  # GitHub repository
+    github_commit_sha: str | None = None  # Git commit SHA for result posting
+
     # Post-test actions
-    create_pr: bool = Field(default=False, description="Create promotion PR on success")
-    send_email: bool = Field(default=False, description="Send email notification on failure")
-    post_results_to_github: bool = Field(default=True, description="Post test results to GitHub commit")
-    
+    create_pr: bool = False  # Create promotion PR on success
+    send_email: bool = False  # Send email notification on failure
+    post_results_to_github: bool = True  # Post test results to GitHub commit
+
     # Services to test
-    services: list[str] = Field(
-        default_factory=lambda: [
-            "access",
-            "audit",
-            "catalog",
-            "customers",
-            "inventory",
-            "orders",
-            "pricing",
-            "sales-dashboard",
-            "sites",
-            "chatbot",
-            "recommender",
-            "auth-b2c",
-            "auth-b2e",
-        ]
-    )
+    services: tuple[str, ...] = _DEFAULT_SERVICES
 
     @classmethod
     def from_mode(cls, mode: str) -> "TestConfig":
@@ -69,8 +70,3 @@ class TestConfig(BaseModel):
             )
         else:
             raise ValueError(f"Unknown mode: {mode}")
-
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
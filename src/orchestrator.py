@@ -2,13 +2,87 @@
 Test orchestrator - coordinates test execution and post-test actions.
 """
 
+import logging
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-
-import pytest
+from pathlib import Path
 
 from src.config import TestConfig
 
+# Resolved once at import rather than on every load test run
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_LOCUSTFILE = _REPO_ROOT / "src" / "tests" / "load" / "locustfile.py"
+_REPORTS_DIR = Path("reports")
+
+# Body of the staging -> main promotion PR
+_PR_BODY_TEMPLATE = """## 🎉 Staging Tests Passed - Ready for Production
+
+{markdown}
+
+---
+
+**Test Environment:** Staging  
+**Tested Commit:** `{sha7}`  
+**Test Duration:** {duration}s  
+**Timestamp:** {timestamp}
+
+<details>
+<summary>📊 Detailed Test Reports</summary>
+
+All test reports are available in CI artifacts:
+- System Tests: ✅ All microservices healthy
+- Load Tests: ✅ Performance requirements met
+- Chaos Tests: ✅ System resilient to failures
+
+</details>
+
+### Next Steps
+
+1. Review changes in this PR
+2. Approve and merge to deploy to production
+3. Monitor production metrics after deployment
+
+---
+*Automated promotion generated by test runner*
+"""
+
+# Body of the commit comment carrying the staging results
+_COMMIT_COMMENT_TEMPLATE = """{markdown}
+
+---
+**Commit:** `{sha7}`  
+**Environment:** Staging  
+**Timestamp:** {timestamp}  
+
+<details>
+<summary>📊 Test Reports</summary>
+
+Generated reports (check CI artifacts):
+- `reports/system.html` - System test results
+- `reports/load.html` - Load test results  
+- `reports/chaos.html` - Chaos test results
+
+</details>
+"""
+
+
+def _get_logger() -> logging.Logger:
+    """
+    Return the orchestrator logger, attaching its stdout handler on first use.
+
+    Logging's handler lock keeps lines from concurrently running suites intact.
+    """
+    logger = logging.getLogger("orchestrator")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
 
 @dataclass
 class TestReport:
@@ -24,19 +98,24 @@ class TestReport:
     def to_markdown(self) -> str:
         """Generate markdown summary of test results."""
         status_emoji = "✅" if self.success else "❌"
-        
-        md = f"# {status_emoji} Staging Test Results\n\n"
-        md += f"**Duration:** {self.duration:.2f}s\n\n"
-        md += "## Test Suites\n\n"
-        
+
+        lines = [
+            f"# {status_emoji} Staging Test Results",
+            "",
+            f"**Duration:** {self.duration:.2f}s",
+            "",
+            "## Test Suites",
+            "",
+        ]
+
         if self.system_passed is not None:
-            md += f"- System Tests: {'✅ PASSED' if self.system_passed else '❌ FAILED'}\n"
+            lines.append(f"- System Tests: {'✅ PASSED' if self.system_passed else '❌ FAILED'}")
         if self.load_passed is not None:
-            md += f"- Load Tests: {'✅ PASSED' if self.load_passed else '❌ FAILED'}\n"
+            lines.append(f"- Load Tests: {'✅ PASSED' if self.load_passed else '❌ FAILED'}")
         if self.chaos_passed is not None:
-            md += f"- Chaos Tests: {'✅ PASSED' if self.chaos_passed else '❌ FAILED'}\n"
-        
-        return md
+            lines.append(f"- Chaos Tests: {'✅ PASSED' if self.chaos_passed else '❌ FAILED'}")
+
+        return "\n".join(lines) + "\n"
     
     def to_commit_status_description(self) -> str:
         """Generate short description for GitHub commit status."""
@@ -56,34 +135,48 @@ class TestOrchestrator:
 
     def __init__(self, config: TestConfig):
         self.config = config
-        self.results = {}
+        self._log = _get_logger()
+        self._github_repo = None
+        self._mode_tag = f"[{config.mode.upper()}]"
+
+        # Ensure reports directory exists before any suite writes to it
+        _REPORTS_DIR.mkdir(exist_ok=True)
 
     def run(self, suite: str) -> TestReport:
         """Run test suite according to mode."""
         start_time = time.time()
         
-        print(f"[{self.config.mode.upper()}] Running tests against {self.config.base_url}")
-        print()
+        self._log.info(f"{self._mode_tag} Running tests against {self.config.base_url}")
 
         # Run tests based on suite
         system_passed = None
         load_passed = None
         chaos_passed = None
 
+        # System and load tests only observe the environment, so they can overlap.
+        # Chaos tests deliberately break services and must run on their own afterwards.
+        concurrent_suites = {}
         if suite in ["all", "system"]:
-            print(f"[{self.config.mode.upper()}] Running system tests...")
-            system_passed = self._run_system_tests()
-            print()
-
+            concurrent_suites["system"] = self._run_system_tests
         if suite in ["all", "load"] and self.config.mode == "staging":
-            print("[STAGING] Running load tests...")
-            load_passed = self._run_load_tests()
-            print()
+            concurrent_suites["load"] = self._run_load_tests
+
+        if concurrent_suites:
+            results = {}
+            with ThreadPoolExecutor(max_workers=len(concurrent_suites)) as executor:
+                futures = {}
+                for name, runner in concurrent_suites.items():
+                    self._log.info(f"{self._mode_tag} Running {name} tests...")
+                    futures[executor.submit(runner)] = name
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+            system_passed = results.get("system")
+            load_passed = results.get("load")
 
         if suite in ["all", "chaos"] and self.config.mode == "staging":
-            print("[STAGING] Running chaos tests...")
+            self._log.info("[STAGING] Running chaos tests...")
             chaos_passed = self._run_chaos_tests()
-            print()
 
         # Calculate overall success
         all_results = [r for r in [system_passed, load_passed, chaos_passed] if r is not None]
@@ -110,58 +203,55 @@ class TestOrchestrator:
 
     def _run_system_tests(self) -> bool:
         """Run pytest system tests."""
-        import sys
+        import subprocess
         
         args = [
             "src/tests/system",
+            "-m", "not slow",  # Per-service health tests are covered by the concurrent sweep
             f"--base-url={self.config.base_url}",
-            "--html=reports/system.html",
-            "--self-contained-html",
-            "-v" if self.config.verbose else "",
             "-s",  # Don't capture output
         ]
-        args = [arg for arg in args if arg]  # Remove empty strings
+        if self.config.verbose:
+            args.append("-v")
+
+        if self.config.mode == "staging":
+            # HTML report is only consumed by the staging GitHub results
+            args += ["--html=reports/system.html", "--self-contained-html"]
 
-        print(f"Running pytest with args: {args}")
-        print(f"Base URL: {self.config.base_url}")
+        self._log.info(f"Running pytest with args: {args}")
+        self._log.info(f"Base URL: {self.config.base_url}")
         
-        exit_code = pytest.main(args)
+        # Separate interpreter so pytest's global state can't leak into (or race with)
+        # the orchestrator and other suites running concurrently
+        result = subprocess.run([sys.executable, "-m", "pytest", *args], check=False)
+        exit_code = result.returncode
         
         if exit_code != 0:
-            print(f"❌ Pytest exited with code {exit_code}")
+            self._log.error(f"❌ Pytest exited with code {exit_code}")
         else:
-            print(f"✅ Pytest passed")
+            self._log.info("✅ Pytest passed")
             
         return exit_code == 0
 
     def _run_load_tests(self) -> bool:
         """Run load tests (staging only)."""
         import os
-        import sys
-        from pathlib import Path
-        
-        # Set Locust parameters from config
-        os.environ["LOCUST_HOST"] = self.config.base_url
+        import subprocess
         
         # Default values for load tests
         users = int(os.getenv("LOCUST_USERS", "10"))
         spawn_rate = int(os.getenv("LOCUST_SPAWN_RATE", "2"))
         run_time = os.getenv("LOCUST_RUN_TIME", "60s")
         
-        # Ensure reports directory exists
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
-        
-        # Locustfile path - use absolute path from working directory
-        locustfile = Path("/app/src/tests/load/locustfile.py")
+        reports_dir = _REPORTS_DIR
         
-        if not locustfile.exists():
-            print(f"❌ Locustfile not found: {locustfile}")
+        if not _LOCUSTFILE.exists():
+            self._log.error(f"❌ Locustfile not found: {_LOCUSTFILE}")
             return False
         
         # Prepare Locust arguments
         locust_args = [
-            "--locustfile", str(locustfile),
+            "--locustfile", str(_LOCUSTFILE),
             "--host", self.config.base_url,
             "--users", str(users),
             "--spawn-rate", str(spawn_rate),
@@ -175,112 +265,94 @@ class TestOrchestrator:
             locust_args.append("--loglevel")
             locust_args.append("DEBUG")
         
-        print(f"Running Locust with args: {' '.join(locust_args)}")
-        print(f"Base URL: {self.config.base_url}")
-        print(f"Users: {users}, Spawn rate: {spawn_rate}/s, Run time: {run_time}")
+        self._log.info(f"Running Locust with args: {' '.join(locust_args)}")
+        self._log.info(f"Base URL: {self.config.base_url}")
+        self._log.info(f"Users: {users}, Spawn rate: {spawn_rate}/s, Run time: {run_time}")
         
-        # Run Locust programmatically
+        # Run Locust in its own interpreter: it monkey-patches sockets with gevent
+        # on import, which must not leak into the orchestrator or concurrent suites
         try:
-            from locust.main import main as locust_main
-            
-            # Save original sys.argv
-            original_argv = sys.argv.copy()
-            
-            # Set sys.argv for Locust
-            sys.argv = ["locust"] + locust_args
-            
-            # Run Locust and catch its sys.exit()
-            try:
-                exit_code = locust_main()
-            except SystemExit as e:
-                # Locust calls sys.exit(), capture the exit code
-                exit_code = e.code if e.code is not None else 0
-            finally:
-                # Always restore original sys.argv
-                sys.argv = original_argv
+            result = subprocess.run(
+                [sys.executable, "-m", "locust", *locust_args],
+                check=False,
+                env={**os.environ, "LOCUST_HOST": self.config.base_url},
+            )
+            exit_code = result.returncode
             
             if exit_code != 0:
-                print(f"❌ Locust exited with code {exit_code}")
+                self._log.error(f"❌ Locust exited with code {exit_code}")
                 return False
             else:
-                print(f"✅ Locust load tests passed")
-                print(f"📊 Report saved to: {reports_dir / 'load.html'}")
+                self._log.info("✅ Locust load tests passed")
+                self._log.info(f"📊 Report saved to: {reports_dir / 'load.html'}")
                 return True
                 
-        except ImportError as e:
-            print(f"❌ Failed to import Locust: {e}")
-            return False
         except Exception as e:
-            print(f"❌ Failed to run Locust: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log.exception(f"❌ Failed to run Locust: {e}")
             return False
 
     def _run_chaos_tests(self) -> bool:
         """Run chaos tests (staging only)."""
         import os
-        import sys
-        from pathlib import Path
+        import subprocess
         
-        print("\n" + "=" * 70)
-        print("🔥 CHAOS TESTING - Pre-flight checks")
-        print("=" * 70)
+        self._log.info("=" * 70)
+        self._log.info("🔥 CHAOS TESTING - Pre-flight checks")
+        self._log.info("=" * 70)
         
         # Verify Kubernetes config is available
         kubeconfig = os.getenv("KUBECONFIG")
         if kubeconfig:
-            print(f"✅ KUBECONFIG: {kubeconfig}")
+            self._log.info(f"✅ KUBECONFIG: {kubeconfig}")
         else:
-            print("⚠️  KUBECONFIG not set - will try in-cluster config")
+            self._log.warning("⚠️  KUBECONFIG not set - will try in-cluster config")
         
         # Verify namespace is set
         namespace = os.getenv("K8S_NAMESPACE", "staging")
-        print(f"✅ K8S_NAMESPACE: {namespace}")
+        self._log.info(f"✅ K8S_NAMESPACE: {namespace}")
         
         # Check if ServiceAccount token exists (in-cluster)
         sa_token_path = "/var/run/secrets/kubernetes.io/serviceaccount/token"
         if os.path.exists(sa_token_path):
-            print(f"✅ ServiceAccount token found (in-cluster mode)")
+            self._log.info("✅ ServiceAccount token found (in-cluster mode)")
         else:
-            print(f"⚠️  No ServiceAccount token - using kubeconfig")
+            self._log.warning("⚠️  No ServiceAccount token - using kubeconfig")
         
         # Verify we can import kubernetes library
         try:
             from kubernetes import client, config as k8s_config
-            print("✅ Kubernetes Python client library available")
+            self._log.info("✅ Kubernetes Python client library available")
         except ImportError as e:
-            print(f"❌ Cannot import kubernetes library: {e}")
-            print("⚠️  Skipping chaos tests - kubernetes library not available")
+            self._log.error(f"❌ Cannot import kubernetes library: {e}")
+            self._log.warning("⚠️  Skipping chaos tests - kubernetes library not available")
             return False
         
         # Try to connect to K8s API
-        print("\n🔧 Testing Kubernetes API connectivity...")
+        self._log.info("🔧 Testing Kubernetes API connectivity...")
         try:
             try:
                 k8s_config.load_incluster_config()
-                print("✅ In-cluster config loaded successfully")
+                self._log.info("✅ In-cluster config loaded successfully")
             except k8s_config.ConfigException:
                 k8s_config.load_kube_config()
-                print("✅ Kubeconfig loaded successfully")
+                self._log.info("✅ Kubeconfig loaded successfully")
             
             api = client.CoreV1Api()
             # Test connectivity by listing pods in our namespace (doesn't require cluster-wide permissions)
             pods = api.list_namespaced_pod(namespace=namespace, limit=1)
-            print(f"✅ Kubernetes API is accessible (found {len(pods.items)} pod(s) in namespace)")
+            self._log.info(
+                f"✅ Kubernetes API is accessible (found {len(pods.items)} pod(s) in namespace)"
+            )
         except Exception as e:
-            print(f"❌ Cannot connect to Kubernetes API: {e}")
-            print("⚠️  Chaos tests cannot run without K8s access")
-            import traceback
-            traceback.print_exc()
+            self._log.exception(f"❌ Cannot connect to Kubernetes API: {e}")
+            self._log.warning("⚠️  Chaos tests cannot run without K8s access")
             return False
         
-        print("\n" + "=" * 70)
-        print("🔥 Starting Chaos Tests")
-        print("=" * 70 + "\n")
+        self._log.info("=" * 70)
+        self._log.info("🔥 Starting Chaos Tests")
+        self._log.info("=" * 70)
         
-        # Ensure reports directory exists
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
+        reports_dir = _REPORTS_DIR
         
         args = [
             "src/tests/chaos",
@@ -288,114 +360,103 @@ class TestOrchestrator:
             f"--base-url={self.config.base_url}",
             "--html=reports/chaos.html",
             "--self-contained-html",
-            "-v" if self.config.verbose else "",
-            "-s",  # Don't capture output
+            # No -s: xdist never shows worker output on the console, so keep it
+            # captured for the failure and HTML reports instead
+            # One worker per chaos module; target services are partitioned per worker
+            "-n", "3",
+            "--dist=loadscope",
         ]
-        args = [arg for arg in args if arg]  # Remove empty strings
+        if self.config.verbose:
+            args.append("-v")
         
-        print(f"pytest args: {args}")
-        print(f"Base URL: {self.config.base_url}")
-        print(f"Namespace: {namespace}\n")
+        self._log.info(f"pytest args: {args}")
+        self._log.info(f"Base URL: {self.config.base_url}")
+        self._log.info(f"Namespace: {namespace}")
         
-        exit_code = pytest.main(args)
+        result = subprocess.run([sys.executable, "-m", "pytest", *args], check=False)
+        exit_code = result.returncode
         
-        print("\n" + "=" * 70)
+        self._log.info("=" * 70)
         if exit_code != 0:
-            print(f"❌ Chaos tests failed with exit code: {exit_code}")
-            print("=" * 70)
+            self._log.error(f"❌ Chaos tests failed with exit code: {exit_code}")
+            self._log.info("=" * 70)
             return False
         else:
-            print(f"✅ Chaos tests passed!")
-            print(f"📊 Report saved to: {reports_dir / 'chaos.html'}")
-            print("=" * 70)
+            self._log.info("✅ Chaos tests passed!")
+            self._log.info(f"📊 Report saved to: {reports_dir / 'chaos.html'}")
+            self._log.info("=" * 70)
             return True
 
     def _handle_pr_results(self, report: TestReport):
         """Handle PR test results (simple output)."""
-        print("=" * 60)
-        print(f"PR Test Results")
-        print("=" * 60)
-        print(f"Status: {'✅ PASSED' if report.success else '❌ FAILED'}")
-        print(f"Duration: {report.duration:.2f}s")
-        print("=" * 60)
+        self._log.info("=" * 60)
+        self._log.info("PR Test Results")
+        self._log.info("=" * 60)
+        self._log.info(f"Status: {'✅ PASSED' if report.success else '❌ FAILED'}")
+        self._log.info(f"Duration: {report.duration:.2f}s")
+        self._log.info("=" * 60)
 
     def _handle_staging_results(self, report: TestReport):
         """Handle staging test results (GitHub notification + PR creation or email)."""
-        print("=" * 60)
-        print(f"Staging Test Results")
-        print("=" * 60)
-        print(report.to_markdown())
+        self._log.info("=" * 60)
+        self._log.info("Staging Test Results")
+        self._log.info("=" * 60)
+
+        # Values shared by every GitHub message, computed once per run
+        from datetime import datetime
+
+        markdown = report.to_markdown()
+        ctx = {
+            "markdown": markdown,
+            "sha7": self.config.github_commit_sha[:7] if self.config.github_commit_sha else "N/A",
+            "duration": f"{report.duration:.2f}",
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+        }
+        self._log.info(markdown)
 
         # Always post results to GitHub (success or failure)
         if self.config.post_results_to_github:
-            print("\n📤 Posting test results to GitHub...")
-            self._post_results_to_github(report)
+            self._log.info("📤 Posting test results to GitHub...")
+            self._post_results_to_github(report, ctx)
 
         # Handle success: create promotion PR
         if report.success:
             if self.config.create_pr:
-                print("\n🎉 All tests passed - Creating promotion PR...")
-                self._create_promotion_pr(report)
+                self._log.info("🎉 All tests passed - Creating promotion PR...")
+                self._create_promotion_pr(report, ctx)
             else:
-                print("\n✅ All tests passed (PR creation disabled)")
+                self._log.info("✅ All tests passed (PR creation disabled)")
         
         # Handle failure: send email notification
         else:
-            print("\n❌ Tests failed")
+            self._log.error("❌ Tests failed")
             if self.config.send_email:
-                print("📧 Sending failure notification...")
+                self._log.info("📧 Sending failure notification...")
                 self._send_failure_email(report)
             else:
-                print("⚠️  Email notifications disabled")
+                self._log.warning("⚠️  Email notifications disabled")
 
-        print("=" * 60)
+        self._log.info("=" * 60)
 
-    def _create_promotion_pr(self, report: TestReport):
+    def _get_github_repo(self):
+        """Return the GitHub repository handle, resolving it once per run."""
+        if self._github_repo is None:
+            from github import Github
+
+            self._github_repo = Github(self.config.github_token).get_repo(self.config.github_repo)
+        return self._github_repo
+
+    def _create_promotion_pr(self, report: TestReport, ctx: dict):
         """Create promotion PR from staging to main with test results."""
         if not self.config.github_token:
-            print("⚠️  GITHUB_TOKEN not set, skipping PR creation")
+            self._log.warning("⚠️  GITHUB_TOKEN not set, skipping PR creation")
             return
 
         try:
-            from github import Github
-            from datetime import datetime
-
-            g = Github(self.config.github_token)
-            repo = g.get_repo(self.config.github_repo)
+            repo = self._get_github_repo()
 
             # Prepare PR body with test results
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-            
-            pr_body = f"""## 🎉 Staging Tests Passed - Ready for Production
-
-{report.to_markdown()}
-
----
-
-**Test Environment:** Staging  
-**Tested Commit:** `{self.config.github_commit_sha[:7] if self.config.github_commit_sha else 'N/A'}`  
-**Test Duration:** {report.duration:.2f}s  
-**Timestamp:** {timestamp}
-
-<details>
-<summary>📊 Detailed Test Reports</summary>
-
-All test reports are available in CI artifacts:
-- System Tests: ✅ All microservices healthy
-- Load Tests: ✅ Performance requirements met
-- Chaos Tests: ✅ System resilient to failures
-
-</details>
-
-### Next Steps
-
-1. Review changes in this PR
-2. Approve and merge to deploy to production
-3. Monitor production metrics after deployment
-
----
-*Automated promotion generated by test runner*
-"""
+            pr_body = _PR_BODY_TEMPLATE.format_map(ctx)
 
             # Create PR
             pr = repo.create_pull(
@@ -405,36 +466,29 @@ All test reports are available in CI artifacts:
                 base="main",
             )
 
-            print(f"✅ Created promotion PR: {pr.html_url}")
-            print(f"   Title: chore: promote staging to main")
-            print(f"   All tests passed and results included in PR description")
+            self._log.info(f"✅ Created promotion PR: {pr.html_url}")
+            self._log.info("   Title: chore: promote staging to main")
+            self._log.info("   All tests passed and results included in PR description")
 
         except Exception as e:
-            print(f"❌ Failed to create PR: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log.exception(f"❌ Failed to create PR: {e}")
 
-    def _post_results_to_github(self, report: TestReport):
+    def _post_results_to_github(self, report: TestReport, ctx: dict):
         """
         Post test results to GitHub via commit status and commit comment.
         
         Always posts results (success or failure) so they're visible on GitHub.
         """
         if not self.config.github_token:
-            print("⚠️  GITHUB_TOKEN not set, skipping GitHub result posting")
+            self._log.warning("⚠️  GITHUB_TOKEN not set, skipping GitHub result posting")
             return
         
         if not self.config.github_commit_sha:
-            print("⚠️  GITHUB_SHA not set, cannot post results to specific commit")
+            self._log.warning("⚠️  GITHUB_SHA not set, cannot post results to specific commit")
             return
         
         try:
-            from github import Github
-            from datetime import datetime
-            
-            g = Github(self.config.github_token)
-            repo = g.get_repo(self.config.github_repo)
-            commit = repo.get_commit(self.config.github_commit_sha)
+            commit = self._get_github_repo().get_commit(self.config.github_commit_sha)
             
             # 1. Create commit status (shows up in PR checks)
             state = "success" if report.success else "failure"
@@ -444,41 +498,21 @@ All test reports are available in CI artifacts:
                 description=report.to_commit_status_description(),
                 context="staging-tests/all"
             )
-            print(f"✅ Posted commit status: {state}")
+            self._log.info(f"✅ Posted commit status: {state}")
             
             # 2. Create commit comment with detailed results
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-            
-            comment_body = f"""{report.to_markdown()}
-
----
-**Commit:** `{self.config.github_commit_sha[:7]}`  
-**Environment:** Staging  
-**Timestamp:** {timestamp}  
-
-<details>
-<summary>📊 Test Reports</summary>
-
-Generated reports (check CI artifacts):
-- `reports/system.html` - System test results
-- `reports/load.html` - Load test results  
-- `reports/chaos.html` - Chaos test results
-
-</details>
-"""
+            comment_body = _COMMIT_COMMENT_TEMPLATE.format_map(ctx)
             
             commit.create_comment(comment_body)
-            print(f"✅ Posted commit comment with detailed results")
+            self._log.info("✅ Posted commit comment with detailed results")
             
-            print(f"✅ Successfully posted results to GitHub for commit {self.config.github_commit_sha[:7]}")
+            self._log.info(f"✅ Successfully posted results to GitHub for commit {ctx['sha7']}")
             
         except Exception as e:
-            print(f"❌ Failed to post results to GitHub: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log.exception(f"❌ Failed to post results to GitHub: {e}")
 
     def _send_failure_email(self, report: TestReport):
         """Send email notification on test failure."""
-        print("TODO: Implement email notification via GitHub Actions")
-        print(f"Would send email with report:\n{report.to_markdown()}")
+        self._log.info("TODO: Implement email notification via GitHub Actions")
+        self._log.info(f"Would send email with report:\n{report.to_markdown()}")
 
@@ -2,88 +2,158 @@
 Pytest configuration and fixtures for chaos tests.
 """
 
+import hashlib
+import logging
+import logging.handlers
 import os
+import queue
+import random
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from kubernetes import client, config
+
+# kubernetes and the HTTP client are imported inside the fixtures that use
+# them. The chaos test modules and helpers defer them the same way, so
+# collecting or deselecting chaos tests doesn't pay for those imports
+
+log = logging.getLogger(__name__)
+
+# Parent of every chaos module logger ("chaos" or "src.tests.chaos" depending on import mode)
+_CHAOS_LOGGER = logging.getLogger(__name__.rpartition(".")[0])
+
+# ChaosHelper logs under this fixed name; echo it separately unless it is
+# already below _CHAOS_LOGGER
+_HELPER_LOGGER = logging.getLogger("chaos.helper")
+_ECHO_LOGGERS = (
+    (_CHAOS_LOGGER,)
+    if _HELPER_LOGGER.name.startswith(f"{_CHAOS_LOGGER.name}.")
+    else (_CHAOS_LOGGER, _HELPER_LOGGER)
+)
+
+_LOG_LISTENER_KEY = pytest.StashKey[logging.handlers.QueueListener]()
+
+
+def pytest_configure(config):
+    """
+    Echo chaos test logging to stdout from a background thread.
+
+    Tests only enqueue records; a QueueListener drains them to the real stdout,
+    so logging never blocks a test on console writes. Records still propagate
+    to pytest's log capture for reports and --log-cli-level.
+
+    xdist does not relay worker stdout to the controller's console, so workers
+    skip the echo; their records only reach the console through pytest's
+    captured-log sections in failure and HTML reports.
+    """
+    for logger in _ECHO_LOGGERS:
+        logger.setLevel(logging.INFO)
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.__stdout__)
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    config.stash[_LOG_LISTENER_KEY] = listener
+
+    handler = logging.handlers.QueueHandler(log_queue)
+    for logger in _ECHO_LOGGERS:
+        logger.addHandler(handler)
+
+
+def pytest_unconfigure(config):
+    """Flush and stop the chaos log listener."""
+    listener = config.stash.get(_LOG_LISTENER_KEY, None)
+    if listener is None:
+        return
+    for logger in _ECHO_LOGGERS:
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+    listener.stop()
 
 
 @pytest.fixture(scope="session")
-def k8s_client():
-    """Provide Kubernetes API client."""
-    print("\n🔧 Initializing Kubernetes client...")
+def _k8s_config():
+    """Load Kubernetes client configuration once for the whole session."""
+    from kubernetes import config
+
+    log.info("🔧 Loading Kubernetes config...")
     try:
         # Try in-cluster config first (when running in K8s pod)
         config.load_incluster_config()
-        print("✅ Using in-cluster Kubernetes config")
+        log.info("✅ Using in-cluster Kubernetes config")
     except config.ConfigException as e:
-        print(f"⚠️  In-cluster config failed: {e}")
-        print("🔧 Trying kubeconfig...")
+        log.warning(f"⚠️  In-cluster config failed: {e}")
+        log.info("🔧 Trying kubeconfig...")
         try:
             # Fallback to kubeconfig (local or CI with KUBECONFIG env var)
             config.load_kube_config()
-            print("✅ Using kubeconfig")
+            log.info("✅ Using kubeconfig")
         except config.ConfigException as e2:
-            print(f"❌ Failed to load Kubernetes config: {e2}")
-            print("💡 Make sure KUBECONFIG is set or pod has ServiceAccount mounted")
+            log.error(f"❌ Failed to load Kubernetes config: {e2}")
+            log.error("💡 Make sure KUBECONFIG is set or pod has ServiceAccount mounted")
             pytest.exit("Cannot access Kubernetes cluster - chaos tests cannot run", returncode=1)
-    
-    api = client.CoreV1Api()
-    
-    # Test connectivity
-    try:
-        version = api.get_api_resources()
-        print(f"✅ Connected to Kubernetes API")
-    except Exception as e:
-        print(f"❌ Cannot connect to Kubernetes API: {e}")
-        pytest.exit("Kubernetes API unreachable - chaos tests cannot run", returncode=1)
-    
-    return api
 
 
 @pytest.fixture(scope="session")
-def k8s_custom_client():
+def _k8s_api_client(_k8s_config):
+    """
+    Provide a single pooled ApiClient shared by every Kubernetes API wrapper.
+
+    Sharing one connection pool lets chaos helper calls and status polls reuse
+    keep-alive connections to the apiserver instead of redoing TLS handshakes.
+    The client is closed at session end so no pooled connections or worker
+    threads leak into a later session in the same process.
+    """
+    from kubernetes import client
+
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = 20
+    api_client = client.ApiClient(configuration)
+    yield api_client
+    api_client.close()
+
+
+@pytest.fixture(scope="session")
+def k8s_client(_k8s_api_client):
+    """Provide Kubernetes API client."""
+    from kubernetes import client
+
+    log.info("🔧 Initializing Kubernetes client...")
+    return client.CoreV1Api(_k8s_api_client)
+
+
+@pytest.fixture(scope="session")
+def k8s_custom_client(_k8s_api_client):
     """Provide Kubernetes custom objects API client for CRDs."""
-    print("🔧 Initializing Kubernetes CustomObjects API client...")
-    try:
-        config.load_incluster_config()
-        print("✅ Using in-cluster config for CRDs")
-    except config.ConfigException:
-        try:
-            config.load_kube_config()
-            print("✅ Using kubeconfig for CRDs")
-        except config.ConfigException as e:
-            print(f"❌ Failed to load Kubernetes config for CRDs: {e}")
-            pytest.exit("Cannot access Kubernetes cluster - chaos tests cannot run", returncode=1)
-    
-    return client.CustomObjectsApi()
+    from kubernetes import client
+
+    log.info("🔧 Initializing Kubernetes CustomObjects API client...")
+    return client.CustomObjectsApi(_k8s_api_client)
 
 
 @pytest.fixture(scope="session")
-def namespace(k8s_client):
-    """Kubernetes namespace for chaos tests."""
-    ns = os.getenv("K8S_NAMESPACE", "staging")
-    print(f"🔧 Using Kubernetes namespace: {ns}")
-    
-    # Verify namespace exists
-    try:
-        k8s_client.read_namespace(ns)
-        print(f"✅ Namespace '{ns}' exists and is accessible")
-    except Exception as e:
-        print(f"❌ Cannot access namespace '{ns}': {e}")
-        pytest.exit(f"Namespace '{ns}' not accessible - check RBAC permissions", returncode=1)
-    
-    # List pods in namespace to verify we can read them
-    try:
-        pods = k8s_client.list_namespaced_pod(namespace=ns, limit=5)
-        pod_count = len(pods.items)
-        print(f"✅ Found {pod_count} pod(s) in namespace (showing first 5)")
-        if pod_count == 0:
-            print("⚠️  WARNING: No pods found in namespace - chaos tests may skip")
-    except Exception as e:
-        print(f"❌ Cannot list pods in namespace '{ns}': {e}")
-        pytest.exit(f"Cannot list pods - check RBAC permissions", returncode=1)
-    
-    return ns
+def api_client(base_url, timeout):
+    """
+    Provide an API client tuned for probing services under chaos.
+
+    Retries are disabled so every failure the chaos causes is observed by the
+    test rather than hidden (and amplified) by urllib3 retries.
+    """
+    from src.tests.helpers.api_client import APIClient
+
+    client = APIClient(
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=0,
+    )
+    yield client
+    client.close()
 
 
 @pytest.fixture(scope="session")
@@ -99,25 +169,182 @@ def chaos_mesh_version():
 
 
 @pytest.fixture(scope="session")
-def verify_chaos_mesh(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version):
-    """Verify Chaos Mesh is installed and accessible."""
-    print("\n🔧 Verifying Chaos Mesh installation...")
-    
-    # Try to list PodChaos CRDs to verify Chaos Mesh is installed
+def _k8s_preflight(k8s_client, k8s_custom_client, chaos_mesh_group, chaos_mesh_version):
+    """
+    Run every session-start cluster check concurrently.
+
+    Verifies API connectivity, namespace access and pod listing in one round of
+    parallel requests. Chaos Mesh is detected from the same API group discovery
+    response used for the connectivity check; a live CRD list is only issued
+    when the group is missing, to surface the underlying error.
+
+    Returns:
+        The verified namespace name
+    """
+    from kubernetes import client
+
+    ns = os.getenv("K8S_NAMESPACE", "staging")
+    log.info(f"🔧 Running Kubernetes pre-flight checks (namespace: {ns})...")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        api_groups = executor.submit(client.ApisApi(k8s_client.api_client).get_api_versions)
+        namespace_read = executor.submit(k8s_client.read_namespace, ns)
+        pods_list = executor.submit(k8s_client.list_namespaced_pod, namespace=ns, limit=5)
+
+    # Report in dependency order so the first failure is the most fundamental one
+    try:
+        discovered = {
+            group.name: {v.version for v in group.versions}
+            for group in api_groups.result().groups
+        }
+        log.info(f"✅ Connected to Kubernetes API")
+    except Exception as e:
+        log.error(f"❌ Cannot connect to Kubernetes API: {e}")
+        pytest.exit("Kubernetes API unreachable - chaos tests cannot run", returncode=1)
+
+    try:
+        namespace_read.result()
+        log.info(f"✅ Namespace '{ns}' exists and is accessible")
+    except Exception as e:
+        log.error(f"❌ Cannot access namespace '{ns}': {e}")
+        pytest.exit(f"Namespace '{ns}' not accessible - check RBAC permissions", returncode=1)
+
+    try:
+        pod_count = len(pods_list.result().items)
+        log.info(f"✅ Found {pod_count} pod(s) in namespace (showing first 5)")
+        if pod_count == 0:
+            log.warning("⚠️  WARNING: No pods found in namespace - chaos tests may skip")
+    except Exception as e:
+        log.error(f"❌ Cannot list pods in namespace '{ns}': {e}")
+        pytest.exit(f"Cannot list pods - check RBAC permissions", returncode=1)
+
+    if chaos_mesh_version in discovered.get(chaos_mesh_group, ()):
+        log.info(f"✅ Chaos Mesh is installed ({chaos_mesh_group}/{chaos_mesh_version})")
+        return ns
+
     try:
-        k8s_custom_client.list_namespaced_custom_object(
-            group=chaos_mesh_group,
-            version=chaos_mesh_version,
-            namespace=namespace,
-            plural="podchaos",
-            limit=1
+        # Existence check only: ask for a metadata-only Table instead of full PodChaos objects
+        k8s_custom_client.api_client.call_api(
+            f"/apis/{chaos_mesh_group}/{chaos_mesh_version}/namespaces/{ns}/podchaos",
+            "GET",
+            header_params={"Accept": "application/json;as=Table;v=v1;g=meta.k8s.io"},
+            query_params=[("limit", "1"), ("includeObject", "Metadata")],
+            response_type="object",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True
         )
-        print("✅ Chaos Mesh is installed and accessible")
-        print(f"✅ Can access PodChaos CRDs in namespace '{namespace}'")
-        return True
+        log.info("✅ Chaos Mesh is installed and accessible")
+        log.info(f"✅ Can access PodChaos CRDs in namespace '{ns}'")
     except Exception as e:
-        print(f"❌ Cannot access Chaos Mesh CRDs: {e}")
-        print("💡 Chaos Mesh may not be installed or RBAC permissions are missing")
-        print("💡 Install with: kubectl apply -f https://mirrors.chaos-mesh.org/latest/crd.yaml")
+        log.error(f"❌ Cannot access Chaos Mesh CRDs: {e}")
+        log.error("💡 Chaos Mesh may not be installed or RBAC permissions are missing")
+        log.error(
+            "💡 Install with: kubectl apply -f https://mirrors.chaos-mesh.org/latest/crd.yaml"
+        )
         pytest.exit("Chaos Mesh not accessible - chaos tests cannot run", returncode=1)
 
+    return ns
+
+
+@pytest.fixture(scope="session")
+def namespace(_k8s_preflight):
+    """Kubernetes namespace for chaos tests."""
+    return _k8s_preflight
+
+
+# Every service a chaos test may target through worker_services. Ownership is
+# assigned over this one sorted list, so it holds across test modules.
+# audit is left out: only test_network_partition injects chaos into it
+_CHAOS_TARGET_SERVICES = (
+    "access",
+    "catalog",
+    "customers",
+    "inventory",
+    "orders",
+    "pricing",
+    "sites",
+)
+
+
+@pytest.fixture(scope="session")
+def worker_services():
+    """
+    Narrow target-service choices to the services this xdist worker owns.
+
+    Each service in _CHAOS_TARGET_SERVICES belongs to exactly one worker
+    (sorted index modulo worker count), whichever module or list it is picked
+    from, so no two workers inject chaos into the same deployment at once and
+    invalidate each other's recovery assertions. A test whose candidates are
+    all owned by other workers is skipped rather than sharing a target.
+    Without xdist every candidate is kept.
+
+    Returns:
+        Function mapping a candidate service list to the services this worker owns
+
+    Raises:
+        ValueError: If a candidate is not listed in _CHAOS_TARGET_SERVICES
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is None:
+        return list
+
+    worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    worker_index = int(worker.removeprefix("gw"))
+    owned_services = set(sorted(_CHAOS_TARGET_SERVICES)[worker_index::worker_count])
+
+    def for_worker(candidates):
+        unknown = set(candidates).difference(_CHAOS_TARGET_SERVICES)
+        if unknown:
+            raise ValueError(f"Not a chaos target service: {sorted(unknown)}")
+
+        owned = [service for service in candidates if service in owned_services]
+        if not owned:
+            pytest.skip(f"No target service in {list(candidates)} is owned by worker {worker}")
+        return owned
+
+    return for_worker
+
+
+@pytest.fixture
+def chaos_rng(request):
+    """
+    Provide a per-test random generator for picking chaos targets.
+
+    Seeded from the test's node id (plus --chaos-seed when given), so a test
+    picks the same service on every run and a flaky run can be reproduced.
+    """
+    seed_option = request.config.getoption("--chaos-seed") or ""
+    digest = hashlib.md5(f"{request.node.nodeid}{seed_option}".encode()).hexdigest()
+    return random.Random(int(digest[:8], 16))
+
+
+@pytest.fixture(scope="session")
+def chaos_helper(
+    k8s_custom_client,
+    namespace,
+    chaos_mesh_group,
+    chaos_mesh_version
+):
+    """
+    Provide a Chaos Mesh helper bound to the verified chaos namespace.
+
+    Every experiment it creates is labelled with a per-session run id, and
+    anything still labelled with it is bulk-deleted on teardown, while the
+    shared Kubernetes ApiClient is still open.
+    """
+    from src.tests.chaos.helpers.chaos_helper import ChaosHelper
+
+    helper = ChaosHelper(
+        k8s_custom_client,
+        namespace,
+        chaos_mesh_group,
+        chaos_mesh_version,
+        run_id=uuid.uuid4().hex
+    )
+    yield helper
+
+    try:
+        helper.delete_run_experiments()
+        log.info(f"✓ Removed leftover chaos experiments (test-run-id={helper.run_id})")
+    except Exception as e:
+        log.warning(f"⚠️  Failed to remove leftover chaos experiments: {e}")
@@ -2,11 +2,48 @@
 Helper class for interacting with Chaos Mesh CRDs.
 """
 
+import itertools
+import logging
+import os
+import random
 import time
-import uuid
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from kubernetes import client
+# kubernetes is imported where it is used, so test modules importing backoff()
+# (and test collection) don't load it
+if TYPE_CHECKING:
+    from kubernetes import client
+
+# Fixed name: this module is imported as src.tests.chaos.helpers.chaos_helper,
+# outside the "chaos" package the test modules log under
+log = logging.getLogger("chaos.helper")
+
+
+# Chaos Mesh CRD plural resource names by kind
+_KIND_TO_PLURAL = {
+    "PodChaos": "podchaos",
+    "NetworkChaos": "networkchaos",
+    "StressChaos": "stresschaos",
+}
+
+
+def backoff(attempt: int, base: float = 1.0, cap: float = 8.0) -> float:
+    """
+    Compute a capped exponential backoff delay with full jitter.
+    
+    Randomizing the whole delay keeps retry loops from synchronizing with
+    other clients and amplifying the fault being injected.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        base: Delay ceiling for the first retry, in seconds
+        cap: Maximum delay ceiling, in seconds
+    
+    Returns:
+        Delay in seconds, uniformly drawn from [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
 
 
 class ChaosHelper:
@@ -14,10 +51,11 @@ class ChaosHelper:
     
     def __init__(
         self,
-        custom_client: client.CustomObjectsApi,
+        custom_client: "client.CustomObjectsApi",
         namespace: str,
         group: str = "chaos-mesh.org",
-        version: str = "v1alpha1"
+        version: str = "v1alpha1",
+        run_id: Optional[str] = None
     ):
         """
         Initialize Chaos Helper.
@@ -27,66 +65,118 @@ class ChaosHelper:
             namespace: Kubernetes namespace
             group: Chaos Mesh API group
             version: Chaos Mesh API version
+            run_id: Optional test-run id, added as a "test-run-id" label to
+                every experiment this helper creates
         """
         self.client = custom_client
         self.namespace = namespace
         self.group = group
         self.version = version
+        self.run_id = run_id
+        
+        # Names are <prefix>-<worker>-<session tag>-<sequence>: unique across xdist
+        # workers and sessions without drawing randomness per experiment
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        session_tag = run_id[:6] if run_id else f"{os.getpid() & 0xFFFF:04x}"
+        self._name_stem = f"{worker}-{session_tag}"
+        self._name_counter = itertools.count()
     
     def _generate_name(self, prefix: str) -> str:
         """Generate unique chaos experiment name."""
-        unique_id = str(uuid.uuid4())[:8]
-        return f"{prefix}-{unique_id}"
+        return f"{prefix}-{self._name_stem}-{next(self._name_counter):04d}"
     
-    def create_pod_chaos(
-        self,
-        action: str,
-        selector: Dict[str, any],
-        duration: str = "30s",
-        mode: str = "one",
-        name: Optional[str] = None
-    ) -> Dict:
+    def _create(self, kind: str, spec: Dict, name: Optional[str] = None) -> Dict:
         """
-        Create PodChaos experiment.
+        Submit a Chaos Mesh experiment of the given kind.
         
         Args:
-            action: Chaos action (pod-kill, pod-failure, container-kill)
-            selector: Pod selector (labelSelectors dict)
-            duration: Experiment duration (e.g., "30s", "2m")
-            mode: Selection mode (one, all, fixed, fixed-percent, random-max-percent)
+            kind: Chaos kind (PodChaos, NetworkChaos, StressChaos)
+            spec: Experiment spec
             name: Optional experiment name
         
         Returns:
             Created chaos object
         """
-        name = name or self._generate_name("podchaos")
+        plural = _KIND_TO_PLURAL[kind]
+        name = name or self._generate_name(plural)
         
         body = {
             "apiVersion": f"{self.group}/{self.version}",
-            "kind": "PodChaos",
+            "kind": kind,
             "metadata": {
                 "name": name,
                 "namespace": self.namespace
             },
-            "spec": {
-                "action": action,
-                "mode": mode,
-                "selector": {
-                    "namespaces": [self.namespace],
-                    "labelSelectors": selector
-                },
-                "duration": duration
-            }
+            "spec": spec
         }
+        if self.run_id:
+            body["metadata"]["labels"] = {"test-run-id": self.run_id}
         
         return self.client.create_namespaced_custom_object(
             group=self.group,
             version=self.version,
             namespace=self.namespace,
-            plural="podchaos",
+            plural=plural,
             body=body
         )
     
+    def create_many(self, experiments: List[Dict]) -> List[Dict]:
+        """
+        Submit several chaos experiments concurrently.
+        
+        Args:
+            experiments: Experiment definitions, each with "kind", "spec" and an optional "name"
+        
+        Returns:
+            Created chaos objects, in the same order as experiments
+        """
+        if not experiments:
+            return []
+        
+        # Overlap apiserver admission latency; map() keeps input order
+        with ThreadPoolExecutor(max_workers=min(8, len(experiments))) as executor:
+            return list(executor.map(
+                lambda exp: self._create(exp["kind"], exp["spec"], exp.get("name")),
+                experiments
+            ))
+    
+    def _selector(self, selector: Dict[str, any]) -> Dict:
+        """Build a Chaos Mesh pod selector scoped to this namespace."""
+        return {
+            "namespaces": [self.namespace],
+            "labelSelectors": selector
+        }
+    
+    def create_pod_chaos(
+        self,
+        action: str,
+        selector: Dict[str, any],
+        duration: str = "30s",
+        mode: str = "one",
+        name: Optional[str] = None
+    ) -> Dict:
+        """
+        Create PodChaos experiment.
+        
+        Args:
+            action: Chaos action (pod-kill, pod-failure, container-kill)
+            selector: Pod selector (labelSelectors dict)
+            duration: Experiment duration (e.g., "30s", "2m")
+            mode: Selection mode (one, all, fixed, fixed-percent, random-max-percent)
+            name: Optional experiment name
+        
+        Returns:
+            Created chaos object
+        """
+        spec = {
+            "action": action,
+            "mode": mode,
+            "selector": self._selector(selector),
+            "duration": duration
+        }
+        
+        return self._create("PodChaos", spec, name)
+    
     def create_network_chaos(
         self,
         action: str,
@@ -114,15 +204,10 @@ class ChaosHelper:
         Returns:
             Created chaos object
         """
-        name = name or self._generate_name("networkchaos")
-        
         spec = {
             "action": action,
             "mode": mode,
-            "selector": {
-                "namespaces": [self.namespace],
-                "labelSelectors": selector
-            },
+            "selector": self._selector(selector),
             "duration": duration,
             "direction": direction
         }
@@ -132,23 +217,7 @@ class ChaosHelper:
         if loss:
             spec["loss"] = loss
         
-        body = {
-            "apiVersion": f"{self.group}/{self.version}",
-            "kind": "NetworkChaos",
-            "metadata": {
-                "name": name,
-                "namespace": self.namespace
-            },
-            "spec": spec
-        }
-        
-        return self.client.create_namespaced_custom_object(
-            group=self.group,
-            version=self.version,
-            namespace=self.namespace,
-            plural="networkchaos",
-            body=body
-        )
+        return self._create("NetworkChaos", spec, name)
     
     def create_stress_chaos(
         self,
@@ -171,33 +240,14 @@ class ChaosHelper:
         Returns:
             Created chaos object
         """
-        name = name or self._generate_name("stresschaos")
-        
-        body = {
-            "apiVersion": f"{self.group}/{self.version}",
-            "kind": "StressChaos",
-            "metadata": {
-                "name": name,
-                "namespace": self.namespace
-            },
-            "spec": {
-                "mode": mode,
-                "selector": {
-                    "namespaces": [self.namespace],
-                    "labelSelectors": selector
-                },
-                "duration": duration,
-                "stressors": stressors or {}
-            }
+        spec = {
+            "mode": mode,
+            "selector": self._selector(selector),
+            "duration": duration,
+            "stressors": stressors or {}
         }
         
-        return self.client.create_namespaced_custom_object(
-            group=self.group,
-            version=self.version,
-            namespace=self.namespace,
-            plural="stresschaos",
-            body=body
-        )
+        return self._create("StressChaos", spec, name)
     
     def delete_chaos(self, kind: str, name: str) -> None:
         """
@@ -207,16 +257,41 @@ class ChaosHelper:
             kind: Chaos kind (PodChaos, NetworkChaos, StressChaos)
             name: Experiment name
         """
-        plural = kind.lower() + "es" if kind.endswith("s") else kind.lower() + "s"
+        from kubernetes import client
         
+        plural = _KIND_TO_PLURAL[kind]
+        
+        # Return as soon as deletion is accepted; Chaos Mesh finalizers recover
+        # the targets in the background instead of blocking test teardown
         self.client.delete_namespaced_custom_object(
             group=self.group,
             version=self.version,
             namespace=self.namespace,
             plural=plural,
-            name=name
+            name=name,
+            body=client.V1DeleteOptions(propagation_policy="Background", grace_period_seconds=0)
         )
     
+    def delete_run_experiments(self) -> None:
+        """
+        Delete every experiment created under this helper's run id.
+        
+        Issues one collection delete per chaos kind, reaping experiments whose
+        tests never reached their own cleanup. No-op without a run id.
+        """
+        if not self.run_id:
+            return
+        
+        for plural in _KIND_TO_PLURAL.values():
+            self.client.delete_collection_namespaced_custom_object(
+                group=self.group,
+                version=self.version,
+                namespace=self.namespace,
+                plural=plural,
+                label_selector=f"test-run-id={self.run_id}",
+                propagation_policy="Background"
+            )
+    
     def get_chaos_status(self, kind: str, name: str) -> Dict:
         """
         Get chaos experiment status.
@@ -228,7 +303,7 @@ class ChaosHelper:
         Returns:
             Chaos object with status
         """
-        plural = kind.lower() + "es" if kind.endswith("s") else kind.lower() + "s"
+        plural = _KIND_TO_PLURAL[kind]
         
         return self.client.get_namespaced_custom_object(
             group=self.group,
@@ -238,6 +313,84 @@ class ChaosHelper:
             name=name
         )
     
+    def wait_until_phase(
+        self,
+        kind: str,
+        name: str,
+        phase: str = "Run",
+        timeout: float = 15,
+        interval: float = 0.2
+    ) -> bool:
+        """
+        Poll a chaos experiment until Chaos Mesh reports it in the given phase.
+        
+        For the "Run" phase the experiment must also have been injected into
+        every selected target, so callers can start measuring immediately.
+        
+        Args:
+            kind: Chaos kind
+            name: Experiment name
+            phase: Desired experiment phase ("Run" or "Stop")
+            timeout: Max wait time in seconds
+            interval: Delay between polls in seconds
+        
+        Returns:
+            True as soon as the phase is reached, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            status = self.get_chaos_status(kind, name).get("status", {})
+            
+            if status.get("experiment", {}).get("desiredPhase") == phase:
+                if phase != "Run" or any(
+                    c.get("type") == "AllInjected" and c.get("status") == "True"
+                    for c in status.get("conditions", [])
+                ):
+                    return True
+            
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+    
+    def wait_until_deleted(
+        self,
+        kind: str,
+        name: str,
+        timeout: float = 30,
+        interval: float = 0.2
+    ) -> bool:
+        """
+        Poll until a deleted chaos experiment is gone from the apiserver.
+        
+        Chaos Mesh holds the object behind a finalizer until it has recovered
+        the targets, so its absence means the fault has been lifted.
+        
+        Args:
+            kind: Chaos kind
+            name: Experiment name
+            timeout: Max wait time in seconds
+            interval: Delay between polls in seconds
+        
+        Returns:
+            True once the experiment is gone, False on timeout
+        """
+        from kubernetes import client
+        
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            try:
+                self.get_chaos_status(kind, name)
+            except client.ApiException as e:
+                if e.status == 404:
+                    return True
+                raise
+            
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+    
     def wait_for_chaos_completion(
         self,
         kind: str,
@@ -255,12 +408,23 @@ class ChaosHelper:
         Returns:
             True if completed successfully, False otherwise
         """
-        start = time.time()
+        from kubernetes import watch
         
-        while time.time() - start < timeout:
-            try:
-                chaos = self.get_chaos_status(kind, name)
-                status = chaos.get("status", {})
+        plural = _KIND_TO_PLURAL[kind]
+        
+        # Let the apiserver push changes to this one object instead of polling it
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.client.list_namespaced_custom_object,
+                group=self.group,
+                version=self.version,
+                namespace=self.namespace,
+                plural=plural,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=timeout
+            ):
+                status = event["object"].get("status", {})
                 
                 # Check if experiment is finished
                 conditions = status.get("conditions", [])
@@ -268,11 +432,10 @@ class ChaosHelper:
                     if condition.get("type") == "AllInjected":
                         if condition.get("status") == "True":
                             return True
-                
-                time.sleep(2)
-            except Exception as e:
-                print(f"Error checking chaos status: {e}")
-                return False
+        except Exception as e:
+            log.warning(f"⚠️  Error checking chaos status: {e}")
+            return False
+        finally:
+            w.stop()
         
         return False
-
@@ -4,33 +4,36 @@ Combined load and chaos tests - the ultimate resilience test.
 These tests run load (Locust) while injecting failures (Chaos Mesh).
 """
 
+import logging
 import os
+import subprocess
 import sys
 import time
-import random
-import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.tests.chaos.helpers.chaos_helper import ChaosHelper
+# Resolved once at import: src/tests/chaos/<this file> -> repository root
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_LOCUSTFILE = _REPO_ROOT / "src" / "tests" / "load" / "locustfile.py"
 
+log = logging.getLogger(__name__)
 
-def run_locust_load(base_url: str, duration: int = 60):
+
+def run_locust_load(base_url: str, duration: int = 60) -> subprocess.Popen:
     """
     Run Locust load in background.
     
     Args:
         base_url: API base URL
         duration: Load duration in seconds
-    """
-    from locust.main import main as locust_main
-    
-    repo_root = Path(__file__).resolve().parents[4]
-    locustfile = repo_root / "src" / "tests" / "load" / "locustfile.py"
     
+    Returns:
+        Handle of the Locust process
+    """
     # Prepare Locust arguments
     locust_args = [
-        "--locustfile", str(locustfile),
+        "--locustfile", str(_LOCUSTFILE),
         "--host", base_url,
         "--users", "5",
         "--spawn-rate", "1",
@@ -39,26 +42,99 @@ def run_locust_load(base_url: str, duration: int = 60):
         "--only-summary",  # Less verbose output
     ]
     
-    # Save and modify sys.argv
-    original_argv = sys.argv.copy()
-    sys.argv = ["locust"] + locust_args
+    # Separate process: no shared sys.argv, no gevent patching of the test process
+    return subprocess.Popen([sys.executable, "-m", "locust", *locust_args])
+
+
+def stop_locust_load(locust_proc: subprocess.Popen | None, timeout: int = 30):
+    """
+    Wait for a background Locust run to finish, killing it if it overruns.
     
+    Args:
+        locust_proc: Handle returned by run_locust_load (or None)
+        timeout: Max wait time in seconds
+    """
+    if locust_proc is None:
+        return
     try:
-        locust_main()
-    finally:
-        sys.argv = original_argv
+        locust_proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        locust_proc.kill()
+        locust_proc.wait()
+
+
+def monitor_health(
+    api_client,
+    path: str,
+    duration: float,
+    timeout: int = 10,
+    min_interval: float = 1.0,
+    max_interval: float = 5.0
+) -> list:
+    """
+    Probe a health endpoint for a fixed duration with an adaptive interval.
+    
+    Probes are started on schedule from worker threads, so a slow response never
+    pushes later samples back. The interval halves after a failed probe (denser
+    sampling while the service is flapping) and grows back towards max_interval
+    while it stays healthy.
+    
+    Args:
+        api_client: API client fixture
+        path: Health endpoint path
+        duration: Total monitoring time in seconds
+        timeout: Per-request timeout in seconds
+        min_interval: Shortest gap between probe start times
+        max_interval: Longest gap between probe start times
+    
+    Returns:
+        List of (healthy, detail) tuples in check order
+    """
+    def probe():
+        probe_start = time.time()
+        try:
+            response = api_client.get(path, timeout=timeout)
+            elapsed = time.time() - probe_start
+            if response.status_code != 200:
+                return False, f"HTTP {response.status_code}"
+            data = response.json()
+            if data.get("status") != "UP":
+                return False, f"unhealthy - {data.get('status')}"
+            return True, f"healthy ({elapsed:.2f}s)"
+        except Exception as e:
+            return False, type(e).__name__
+    
+    deadline = time.monotonic() + duration
+    interval = max_interval
+    futures = []
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while True:
+            futures.append(executor.submit(probe))
+            if time.monotonic() + interval >= deadline:
+                break
+            time.sleep(interval)
+            
+            # Adapt to the most recent probe that has completed
+            latest = next((f for f in reversed(futures) if f.done()), None)
+            if latest is not None:
+                healthy, _ = latest.result()
+                if healthy:
+                    interval = min(max_interval, interval * 1.5)
+                else:
+                    interval = max(min_interval, interval / 2)
+        
+        return [f.result() for f in futures]
 
 
 @pytest.mark.chaos
 @pytest.mark.slow
 def test_load_with_pod_failures(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     base_url,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test system behavior under load while killing pods.
@@ -69,31 +145,24 @@ def test_load_with_pod_failures(
     3. Verify system remains available
     4. Check that services recover
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "inventory", "pricing"]))
     
-    service = random.choice(["catalog", "orders", "inventory", "pricing"])
-    
-    print(f"\n🔥💥 Ultimate test: Load + Pod failures for service: {service}")
+    log.info(f"🔥💥 Ultimate test: Load + Pod failures for service: {service}")
     
     chaos_name = None
-    locust_thread = None
+    locust_proc = None
     
     try:
-        # Start Locust in background thread
-        print(f"✓ Starting load test (60s)...")
-        locust_thread = threading.Thread(
-            target=run_locust_load,
-            args=(base_url, 60),
-            daemon=True
-        )
-        locust_thread.start()
+        # Start Locust in background process
+        log.info(f"✓ Starting load test (60s)...")
+        locust_proc = run_locust_load(base_url, 60)
         
         # Wait a bit for load to ramp up
         time.sleep(10)
         
         # Create chaos experiment
-        print(f"✓ Injecting pod failures for {service}...")
-        chaos_obj = chaos.create_pod_chaos(
+        log.info(f"✓ Injecting pod failures for {service}...")
+        chaos_obj = chaos_helper.create_pod_chaos(
             action="pod-kill",
             selector={"app": service},
             duration="30s",
@@ -101,37 +170,23 @@ def test_load_with_pod_failures(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Chaos experiment created: {chaos_name}")
+        log.info(f"✓ Chaos experiment created: {chaos_name}")
         
         # Monitor service health during chaos
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Monitoring {service} during load + chaos...")
+        log.info(f"✓ Monitoring {service} during load + chaos...")
         
-        checks = 0
-        successes = 0
+        results = monitor_health(api_client, path, duration=40, timeout=10)
+        for i, (healthy, detail) in enumerate(results):
+            log.info(f"  {'✓' if healthy else '✗'} Check {i+1}: {detail}")
         
-        for i in range(8):  # Monitor for 40s
-            try:
-                response = api_client.get(path, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "UP":
-                        successes += 1
-                        print(f"  ✓ Check {i+1}: healthy")
-                    else:
-                        print(f"  ✗ Check {i+1}: unhealthy - {data.get('status')}")
-                else:
-                    print(f"  ✗ Check {i+1}: HTTP {response.status_code}")
-            except Exception as e:
-                print(f"  ✗ Check {i+1}: {type(e).__name__}")
-            
-            checks += 1
-            time.sleep(5)
+        checks = len(results)
+        successes = sum(1 for healthy, _ in results if healthy)
         
         # Calculate success rate
         success_rate = successes / checks if checks > 0 else 0
-        print(f"✓ Success rate during chaos: {success_rate:.0%} ({successes}/{checks})")
+        log.info(f"✓ Success rate during chaos: {success_rate:.0%} ({successes}/{checks})")
         
         # System should maintain at least 40% availability under combined stress
         # (Some failures expected during pod restart)
@@ -140,9 +195,8 @@ def test_load_with_pod_failures(
         )
         
         # Wait for Locust to finish
-        if locust_thread and locust_thread.is_alive():
-            print(f"✓ Waiting for load test to complete...")
-            locust_thread.join(timeout=30)
+        log.info(f"✓ Waiting for load test to complete...")
+        stop_locust_load(locust_proc)
         
         # Final health check
         time.sleep(5)
@@ -152,59 +206,52 @@ def test_load_with_pod_failures(
         data = response.json()
         assert data.get("status") == "UP"
         
-        print(f"✅ System maintained {success_rate:.0%} availability under load + pod failures")
-        print(f"✅ Service {service} fully recovered after chaos")
+        log.info(f"✅ System maintained {success_rate:.0%} availability under load + pod failures")
+        log.info(f"✅ Service {service} fully recovered after chaos")
         
     finally:
+        # Don't leave load running after a failed assertion
+        stop_locust_load(locust_proc, timeout=0)
         if chaos_name:
             try:
-                chaos.delete_chaos("PodChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("PodChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
 
 @pytest.mark.chaos
 @pytest.mark.slow
 def test_load_with_network_latency(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     base_url,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test system behavior under load with increased network latency.
     
     Verifies that the system degrades gracefully under network stress.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
-    service = random.choice(["catalog", "orders", "pricing"])
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "pricing"]))
     latency = "300ms"
     
-    print(f"\n🔥💥 Ultimate test: Load + Network latency ({latency}) for service: {service}")
+    log.info(f"🔥💥 Ultimate test: Load + Network latency ({latency}) for service: {service}")
     
     chaos_name = None
-    locust_thread = None
+    locust_proc = None
     
     try:
         # Start Locust
-        print(f"✓ Starting load test (60s)...")
-        locust_thread = threading.Thread(
-            target=run_locust_load,
-            args=(base_url, 60),
-            daemon=True
-        )
-        locust_thread.start()
+        log.info(f"✓ Starting load test (60s)...")
+        locust_proc = run_locust_load(base_url, 60)
         
         time.sleep(10)
         
         # Inject network latency
-        print(f"✓ Injecting {latency} network latency to {service}...")
-        chaos_obj = chaos.create_network_chaos(
+        log.info(f"✓ Injecting {latency} network latency to {service}...")
+        chaos_obj = chaos_helper.create_network_chaos(
             action="delay",
             selector={"app": service},
             duration="40s",
@@ -218,39 +265,22 @@ def test_load_with_network_latency(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Chaos experiment created: {chaos_name}")
+        log.info(f"✓ Chaos experiment created: {chaos_name}")
         
         # Monitor during latency
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Monitoring {service} during load + latency...")
+        log.info(f"✓ Monitoring {service} during load + latency...")
         
-        checks = 0
-        successes = 0
+        results = monitor_health(api_client, path, duration=30, timeout=15)
+        for i, (healthy, detail) in enumerate(results):
+            log.info(f"  {'✓' if healthy else '✗'} Check {i+1}: {detail}")
         
-        for i in range(6):  # 30s monitoring
-            try:
-                start = time.time()
-                response = api_client.get(path, timeout=15)
-                elapsed = time.time() - start
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "UP":
-                        successes += 1
-                        print(f"  ✓ Check {i+1}: healthy ({elapsed:.2f}s)")
-                    else:
-                        print(f"  ✗ Check {i+1}: unhealthy")
-                else:
-                    print(f"  ✗ Check {i+1}: HTTP {response.status_code}")
-            except Exception as e:
-                print(f"  ✗ Check {i+1}: timeout or error")
-            
-            checks += 1
-            time.sleep(5)
+        checks = len(results)
+        successes = sum(1 for healthy, _ in results if healthy)
         
         success_rate = successes / checks if checks > 0 else 0
-        print(f"✓ Success rate during latency: {success_rate:.0%} ({successes}/{checks})")
+        log.info(f"✓ Success rate during latency: {success_rate:.0%} ({successes}/{checks})")
         
         # Should maintain at least 60% availability (slower but functional)
         assert success_rate >= 0.6, (
@@ -258,16 +288,19 @@ def test_load_with_network_latency(
         )
         
         # Wait for load test
-        if locust_thread and locust_thread.is_alive():
-            locust_thread.join(timeout=30)
+        stop_locust_load(locust_proc)
         
-        print(f"✅ System maintained {success_rate:.0%} availability under load + network latency")
+        log.info(
+            f"✅ System maintained {success_rate:.0%} availability under load + network latency"
+        )
         
     finally:
+        # Don't leave load running after a failed assertion
+        stop_locust_load(locust_proc, timeout=0)
         if chaos_name:
             try:
-                chaos.delete_chaos("NetworkChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("NetworkChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
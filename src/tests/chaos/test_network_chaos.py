@@ -2,21 +2,21 @@
 Test network chaos scenarios using Chaos Mesh NetworkChaos.
 """
 
+import logging
 import time
-import random
 import pytest
 
-from src.tests.chaos.helpers.chaos_helper import ChaosHelper
+from src.tests.chaos.helpers.chaos_helper import backoff
+
+log = logging.getLogger(__name__)
 
 
 @pytest.mark.chaos
 def test_network_latency(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test that services handle increased network latency gracefully.
@@ -25,17 +25,15 @@ def test_network_latency(
     1. Service remains available (slower but functional)
     2. Health checks still pass (with increased timeout)
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
-    service = random.choice(["catalog", "orders", "inventory", "pricing"])
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "inventory", "pricing"]))
     latency_ms = "200ms"
     
-    print(f"\n🔥 Testing network latency ({latency_ms}) for service: {service}")
+    log.info(f"🔥 Testing network latency ({latency_ms}) for service: {service}")
     
     chaos_name = None
     try:
         # Create NetworkChaos with delay
-        chaos_obj = chaos.create_network_chaos(
+        chaos_obj = chaos_helper.create_network_chaos(
             action="delay",
             selector={"app": service},
             duration="45s",
@@ -49,16 +47,17 @@ def test_network_latency(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created NetworkChaos experiment: {chaos_name}")
-        print(f"✓ Injected {latency_ms} latency to all {service} pods")
+        log.info(f"✓ Created NetworkChaos experiment: {chaos_name}")
+        log.info(f"✓ Injected {latency_ms} latency to all {service} pods")
         
         # Wait for chaos to be active
-        time.sleep(5)
+        if not chaos_helper.wait_until_phase("NetworkChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify service is still responsive (but slower)
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Testing service response with latency...")
+        log.info(f"✓ Testing service response with latency...")
         start = time.time()
         response = api_client.get(path, timeout=15)  # Increased timeout
         elapsed = time.time() - start
@@ -68,26 +67,23 @@ def test_network_latency(
         data = response.json()
         assert data.get("status") == "UP", f"Service {service} unhealthy under latency"
         
-        print(f"✓ Service responded in {elapsed:.2f}s (latency applied)")
-        print(f"✅ Service {service} handles network latency gracefully")
+        log.info(f"✓ Service responded in {elapsed:.2f}s (latency applied)")
+        log.info(f"✅ Service {service} handles network latency gracefully")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("NetworkChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("NetworkChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
 
 @pytest.mark.chaos
 def test_network_partition(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services
 ):
     """
     Test service behavior during network partition.
@@ -95,18 +91,16 @@ def test_network_partition(
     Simulates network partition by blocking traffic to/from a service.
     Verifies that other services continue to operate.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
     # Pick a non-critical service to partition
     partitioned_service = "audit"  # Audit is async, other services can tolerate it being down
-    healthy_service = "catalog"
+    healthy_service = worker_services(["catalog", "orders", "inventory", "pricing"])[0]
     
-    print(f"\n🔥 Testing network partition for service: {partitioned_service}")
+    log.info(f"🔥 Testing network partition for service: {partitioned_service}")
     
     chaos_name = None
     try:
         # Create NetworkChaos with partition action
-        chaos_obj = chaos.create_network_chaos(
+        chaos_obj = chaos_helper.create_network_chaos(
             action="partition",
             selector={"app": partitioned_service},
             duration="30s",
@@ -115,26 +109,27 @@ def test_network_partition(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created NetworkChaos experiment: {chaos_name}")
-        print(f"✓ Network partition applied to {partitioned_service}")
+        log.info(f"✓ Created NetworkChaos experiment: {chaos_name}")
+        log.info(f"✓ Network partition applied to {partitioned_service}")
         
         # Wait for partition to be active
-        time.sleep(5)
+        if not chaos_helper.wait_until_phase("NetworkChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify partitioned service is unreachable
-        print(f"✓ Verifying {partitioned_service} is partitioned...")
+        log.info(f"✓ Verifying {partitioned_service} is partitioned...")
         path = f"/api/{partitioned_service}/actuator/health"
         
         try:
             response = api_client.get(path, timeout=5)
             # If we get here, partition might not be working fully
             # But that's okay for this test
-            print(f"⚠️  {partitioned_service} still reachable (partial partition)")
+            log.warning(f"⚠️  {partitioned_service} still reachable (partial partition)")
         except Exception:
-            print(f"✓ {partitioned_service} is unreachable (partition successful)")
+            log.info(f"✓ {partitioned_service} is unreachable (partition successful)")
         
         # Verify other services are still healthy
-        print(f"✓ Verifying other services remain healthy...")
+        log.info(f"✓ Verifying other services remain healthy...")
         path = f"/api/{healthy_service}/actuator/health"
         response = api_client.get(path, timeout=10)
         
@@ -142,45 +137,41 @@ def test_network_partition(
         data = response.json()
         assert data.get("status") == "UP"
         
-        print(f"✓ Service {healthy_service} remains healthy during partition")
-        print(f"✅ System tolerates network partition of {partitioned_service}")
+        log.info(f"✓ Service {healthy_service} remains healthy during partition")
+        log.info(f"✅ System tolerates network partition of {partitioned_service}")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("NetworkChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("NetworkChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
                 
-                # Wait a bit for network to recover
-                time.sleep(5)
+                # Wait for Chaos Mesh to lift the partition
+                chaos_helper.wait_until_deleted("NetworkChaos", chaos_name)
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
 
 @pytest.mark.chaos
 def test_packet_loss(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test service resilience to packet loss.
     
     Injects 30% packet loss and verifies service remains functional.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
-    service = random.choice(["orders", "inventory", "pricing"])
+    service = chaos_rng.choice(worker_services(["orders", "inventory", "pricing"]))
     loss_percent = "30"
     
-    print(f"\n🔥 Testing packet loss ({loss_percent}%) for service: {service}")
+    log.info(f"🔥 Testing packet loss ({loss_percent}%) for service: {service}")
     
     chaos_name = None
     try:
-        chaos_obj = chaos.create_network_chaos(
+        chaos_obj = chaos_helper.create_network_chaos(
             action="loss",
             selector={"app": service},
             duration="45s",
@@ -193,10 +184,11 @@ def test_packet_loss(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created NetworkChaos experiment: {chaos_name}")
-        print(f"✓ Injected {loss_percent}% packet loss")
+        log.info(f"✓ Created NetworkChaos experiment: {chaos_name}")
+        log.info(f"✓ Injected {loss_percent}% packet loss")
         
-        time.sleep(5)
+        if not chaos_helper.wait_until_phase("NetworkChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify service still responds (may need retries)
         path = f"/api/{service}/actuator/health"
@@ -211,21 +203,22 @@ def test_packet_loss(
                     data = response.json()
                     if data.get("status") == "UP":
                         success = True
-                        print(f"✓ Service responded successfully on attempt {attempt + 1}")
+                        log.info(f"✓ Service responded successfully on attempt {attempt + 1}")
                         break
             except Exception as e:
-                print(f"⚠️  Attempt {attempt + 1} failed: {e}")
-                time.sleep(2)
+                log.warning(f"⚠️  Attempt {attempt + 1} failed: {e}")
+                if attempt < max_attempts - 1:
+                    time.sleep(backoff(attempt, base=2.0))
         
         assert success, f"Service {service} failed to respond after {max_attempts} attempts with {loss_percent}% packet loss"
         
-        print(f"✅ Service {service} handles {loss_percent}% packet loss")
+        log.info(f"✅ Service {service} handles {loss_percent}% packet loss")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("NetworkChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("NetworkChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
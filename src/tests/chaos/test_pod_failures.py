@@ -2,14 +2,15 @@
 Test pod failure recovery using Chaos Mesh PodChaos.
 """
 
+import logging
 import time
-import random
 import pytest
 
-from src.tests.chaos.helpers.chaos_helper import ChaosHelper
+log = logging.getLogger(__name__)
 
 
-# Services we can safely kill and expect automatic recovery
+# Services we can safely kill and expect automatic recovery. audit is left out:
+# test_network_partition always partitions it, possibly on another xdist worker
 RESILIENT_SERVICES = [
     "catalog",
     "orders",
@@ -18,19 +19,76 @@ RESILIENT_SERVICES = [
     "pricing",
     "sites",
     "access",
-    "audit",
 ]
 
 
+def _is_pod_ready(pod) -> bool:
+    """Check whether a pod is Running, Ready and not terminating."""
+    # Pending/terminating pods skip the conditions scan entirely; killed pods
+    # keep reporting Running/Ready while they terminate
+    if pod.status.phase != "Running" or pod.metadata.deletion_timestamp:
+        return False
+    for condition in pod.status.conditions or ():
+        if getattr(condition, "type", None) == "Ready":
+            return getattr(condition, "status", None) == "True"
+    return False
+
+
+def wait_for_ready_pods(
+    k8s_client,
+    namespace: str,
+    label_selector: str,
+    min_ready: int,
+    timeout: int
+) -> int:
+    """
+    Watch a service's pods until at least min_ready of them are ready.
+    
+    Args:
+        k8s_client: Kubernetes CoreV1Api client
+        namespace: Kubernetes namespace
+        label_selector: Label selector matching the service's pods (e.g. "app=catalog")
+        min_ready: Number of ready pods to wait for
+        timeout: Max wait time in seconds
+    
+    Returns:
+        Number of ready pods when the wait ended
+    """
+    from kubernetes import watch
+    
+    ready = set()
+    
+    # The watch replays current pods as ADDED events, then pushes every change
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            k8s_client.list_namespaced_pod,
+            namespace=namespace,
+            label_selector=label_selector,
+            timeout_seconds=timeout
+        ):
+            pod = event["object"]
+            if event["type"] != "DELETED" and _is_pod_ready(pod):
+                ready.add(pod.metadata.name)
+            else:
+                ready.discard(pod.metadata.name)
+            
+            if len(ready) >= min_ready:
+                break
+    finally:
+        w.stop()
+    
+    return len(ready)
+
+
 @pytest.mark.chaos
 def test_pod_deletion_recovery(
     k8s_client,
-    k8s_custom_client,
+    chaos_helper,
     namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test that a service recovers after a pod is killed.
@@ -42,17 +100,17 @@ def test_pod_deletion_recovery(
     4. Verify new pod is created and running
     5. Verify service health check passes
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
     # Pick random service
-    service = random.choice(RESILIENT_SERVICES)
+    service = chaos_rng.choice(worker_services(RESILIENT_SERVICES))
     
-    print(f"\n🔥 Testing pod deletion recovery for service: {service}")
+    selector = f"app={service}"
+    
+    log.info(f"🔥 Testing pod deletion recovery for service: {service}")
     
     # Create PodChaos experiment
     chaos_name = None
     try:
-        chaos_obj = chaos.create_pod_chaos(
+        chaos_obj = chaos_helper.create_pod_chaos(
             action="pod-kill",
             selector={"app": service},
             duration="30s",
@@ -60,45 +118,23 @@ def test_pod_deletion_recovery(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created PodChaos experiment: {chaos_name}")
+        log.info(f"✓ Created PodChaos experiment: {chaos_name}")
         
-        # Wait a bit for pod to be killed
-        time.sleep(10)
+        # Wait for pod to be killed
+        if not chaos_helper.wait_until_phase("PodChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Check that new pods are running
         max_wait = 60
-        start = time.time()
-        pod_recovered = False
-        
-        while time.time() - start < max_wait:
-            pods = k8s_client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=f"app={service}"
-            )
-            
-            running_pods = [p for p in pods.items if p.status.phase == "Running"]
-            
-            if len(running_pods) > 0:
-                # Check if pods are actually ready
-                ready_pods = [
-                    p for p in running_pods
-                    if p.status.conditions and any(
-                        c.type == "Ready" and c.status == "True"
-                        for c in p.status.conditions
-                    )
-                ]
-                
-                if ready_pods:
-                    print(f"✓ Service {service} has {len(ready_pods)} ready pod(s)")
-                    pod_recovered = True
-                    break
-            
-            time.sleep(2)
+        ready_count = wait_for_ready_pods(
+            k8s_client, namespace, selector, min_ready=1, timeout=max_wait
+        )
         
-        assert pod_recovered, f"Service {service} did not recover within {max_wait}s"
+        assert ready_count > 0, f"Service {service} did not recover within {max_wait}s"
+        log.info(f"✓ Service {service} has {ready_count} ready pod(s)")
         
         # Verify service health via API
-        print(f"✓ Verifying service health via API...")
+        log.info(f"✓ Verifying service health via API...")
         path = f"/api/{service}/actuator/health"
         
         # Give a bit more time for service to be fully ready
@@ -110,48 +146,47 @@ def test_pod_deletion_recovery(
         data = response.json()
         assert data.get("status") == "UP", f"Service {service} status is not UP: {data}"
         
-        print(f"✅ Service {service} successfully recovered from pod deletion")
+        log.info(f"✅ Service {service} successfully recovered from pod deletion")
         
     finally:
         # Cleanup: delete chaos experiment
         if chaos_name:
             try:
-                chaos.delete_chaos("PodChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("PodChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup chaos experiment: {e}")
+                log.warning(f"⚠️  Failed to cleanup chaos experiment: {e}")
 
 
 @pytest.mark.chaos
 def test_multiple_pod_failures(
     k8s_client,
-    k8s_custom_client,
+    chaos_helper,
     namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test that a service recovers when multiple pods are killed simultaneously.
     
     This simulates a more severe outage where multiple instances fail at once.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
     # Pick a service that typically has multiple replicas
-    service = random.choice(["catalog", "orders", "inventory"])
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "inventory"]))
+    
+    selector = f"app={service}"
     
-    print(f"\n🔥 Testing multiple pod failures for service: {service}")
+    log.info(f"🔥 Testing multiple pod failures for service: {service}")
     
     # Check how many pods exist
     pods = k8s_client.list_namespaced_pod(
         namespace=namespace,
-        label_selector=f"app={service}"
+        label_selector=selector
     )
     
-    pod_count = len([p for p in pods.items if p.status.phase == "Running"])
-    print(f"✓ Service {service} currently has {pod_count} running pod(s)")
+    pod_count = sum(1 for p in pods.items if p.status.phase == "Running")
+    log.info(f"✓ Service {service} currently has {pod_count} running pod(s)")
     
     if pod_count < 2:
         pytest.skip(f"Service {service} has less than 2 pods, skipping multiple failure test")
@@ -162,7 +197,7 @@ def test_multiple_pod_failures(
         mode = "fixed"
         value = min(2, pod_count // 2) if pod_count > 2 else 1
         
-        chaos_obj = chaos.create_pod_chaos(
+        chaos_obj = chaos_helper.create_pod_chaos(
             action="pod-kill",
             selector={"app": service},
             duration="30s",
@@ -172,39 +207,24 @@ def test_multiple_pod_failures(
         # Add value to spec if using fixed mode
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created PodChaos experiment: {chaos_name} (targeting {value} pod(s))")
+        log.info(f"✓ Created PodChaos experiment: {chaos_name} (targeting {value} pod(s))")
         
-        # Wait for pods to be killed and recover
-        time.sleep(15)
+        # Wait for pods to be killed
+        if not chaos_helper.wait_until_phase("PodChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify recovery
         max_wait = 90
-        start = time.time()
+        ready_count = wait_for_ready_pods(
+            k8s_client, namespace, selector, min_ready=pod_count, timeout=max_wait
+        )
         
-        while time.time() - start < max_wait:
-            pods = k8s_client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=f"app={service}"
-            )
-            
-            ready_pods = [
-                p for p in pods.items
-                if p.status.phase == "Running" and p.status.conditions and any(
-                    c.type == "Ready" and c.status == "True"
-                    for c in p.status.conditions
-                )
-            ]
-            
-            if len(ready_pods) >= pod_count:
-                print(f"✓ Service {service} recovered all {len(ready_pods)} pods")
-                break
-            
-            time.sleep(3)
-        else:
+        if ready_count < pod_count:
             pytest.fail(f"Service {service} did not fully recover within {max_wait}s")
+        log.info(f"✓ Service {service} recovered all {ready_count} pods")
         
         # Verify service health
-        print(f"✓ Verifying service health via API...")
+        log.info(f"✓ Verifying service health via API...")
         time.sleep(5)
         
         path = f"/api/{service}/actuator/health"
@@ -214,13 +234,13 @@ def test_multiple_pod_failures(
         data = response.json()
         assert data.get("status") == "UP"
         
-        print(f"✅ Service {service} successfully recovered from multiple pod failures")
+        log.info(f"✅ Service {service} successfully recovered from multiple pod failures")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("PodChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("PodChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
@@ -2,37 +2,36 @@
 Test resource stress scenarios using Chaos Mesh StressChaos.
 """
 
+import logging
 import time
-import random
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
-from src.tests.chaos.helpers.chaos_helper import ChaosHelper
+from src.tests.chaos.helpers.chaos_helper import backoff
+
+log = logging.getLogger(__name__)
 
 
 @pytest.mark.chaos
 def test_cpu_stress(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test service resilience under CPU stress.
     
     Applies CPU stress to a service and verifies it remains responsive.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
-    service = random.choice(["catalog", "orders", "pricing", "inventory"])
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "pricing", "inventory"]))
     
-    print(f"\n🔥 Testing CPU stress for service: {service}")
+    log.info(f"🔥 Testing CPU stress for service: {service}")
     
     chaos_name = None
     try:
         # Create StressChaos with CPU stress
-        chaos_obj = chaos.create_stress_chaos(
+        chaos_obj = chaos_helper.create_stress_chaos(
             selector={"app": service},
             duration="45s",
             mode="one",  # Stress one pod
@@ -45,16 +44,17 @@ def test_cpu_stress(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created StressChaos experiment: {chaos_name}")
-        print(f"✓ Applying CPU stress (2 workers, 80% load)")
+        log.info(f"✓ Created StressChaos experiment: {chaos_name}")
+        log.info(f"✓ Applying CPU stress (2 workers, 80% load)")
         
         # Wait for stress to be active
-        time.sleep(5)
+        if not chaos_helper.wait_until_phase("StressChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify service remains responsive
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Testing service response under CPU stress...")
+        log.info(f"✓ Testing service response under CPU stress...")
         
         # Try multiple times to account for slower responses
         max_attempts = 3
@@ -70,49 +70,46 @@ def test_cpu_stress(
                     data = response.json()
                     if data.get("status") == "UP":
                         success = True
-                        print(f"✓ Service responded in {elapsed:.2f}s (attempt {attempt + 1})")
+                        log.info(f"✓ Service responded in {elapsed:.2f}s (attempt {attempt + 1})")
                         break
             except Exception as e:
-                print(f"⚠️  Attempt {attempt + 1} failed: {e}")
-                time.sleep(3)
+                log.warning(f"⚠️  Attempt {attempt + 1} failed: {e}")
+                if attempt < max_attempts - 1:
+                    time.sleep(backoff(attempt, base=3.0))
         
         assert success, f"Service {service} failed to respond under CPU stress"
         
-        print(f"✅ Service {service} remains responsive under CPU stress")
+        log.info(f"✅ Service {service} remains responsive under CPU stress")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("StressChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("StressChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
 
 @pytest.mark.chaos
 def test_memory_stress(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test service resilience under memory stress.
     
     Applies memory stress to a service and verifies it doesn't crash.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
-    
-    service = random.choice(["catalog", "orders", "customers"])
+    service = chaos_rng.choice(worker_services(["catalog", "orders", "customers"]))
     
-    print(f"\n🔥 Testing memory stress for service: {service}")
+    log.info(f"🔥 Testing memory stress for service: {service}")
     
     chaos_name = None
     try:
         # Create StressChaos with memory stress
-        chaos_obj = chaos.create_stress_chaos(
+        chaos_obj = chaos_helper.create_stress_chaos(
             selector={"app": service},
             duration="45s",
             mode="one",
@@ -125,15 +122,16 @@ def test_memory_stress(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created StressChaos experiment: {chaos_name}")
-        print(f"✓ Applying memory stress (256MB allocation)")
+        log.info(f"✓ Created StressChaos experiment: {chaos_name}")
+        log.info(f"✓ Applying memory stress (256MB allocation)")
         
-        time.sleep(5)
+        if not chaos_helper.wait_until_phase("StressChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Verify service remains responsive
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Testing service response under memory stress...")
+        log.info(f"✓ Testing service response under memory stress...")
         
         max_attempts = 3
         success = False
@@ -146,49 +144,46 @@ def test_memory_stress(
                     data = response.json()
                     if data.get("status") == "UP":
                         success = True
-                        print(f"✓ Service healthy (attempt {attempt + 1})")
+                        log.info(f"✓ Service healthy (attempt {attempt + 1})")
                         break
             except Exception as e:
-                print(f"⚠️  Attempt {attempt + 1} failed: {e}")
-                time.sleep(3)
+                log.warning(f"⚠️  Attempt {attempt + 1} failed: {e}")
+                if attempt < max_attempts - 1:
+                    time.sleep(backoff(attempt, base=3.0))
         
         assert success, f"Service {service} failed under memory stress"
         
-        print(f"✅ Service {service} remains stable under memory stress")
+        log.info(f"✅ Service {service} remains stable under memory stress")
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("StressChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("StressChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
 
 @pytest.mark.chaos
 def test_combined_cpu_memory_stress(
-    k8s_custom_client,
-    namespace,
-    chaos_mesh_group,
-    chaos_mesh_version,
+    chaos_helper,
     api_client,
-    verify_chaos_mesh
+    worker_services,
+    chaos_rng
 ):
     """
     Test service under combined CPU and memory stress.
     
     This simulates a more realistic high-load scenario.
     """
-    chaos = ChaosHelper(k8s_custom_client, namespace, chaos_mesh_group, chaos_mesh_version)
+    service = chaos_rng.choice(worker_services(["orders", "pricing", "inventory"]))
     
-    service = random.choice(["orders", "pricing", "inventory"])
-    
-    print(f"\n🔥 Testing combined CPU+Memory stress for service: {service}")
+    log.info(f"🔥 Testing combined CPU+Memory stress for service: {service}")
     
     chaos_name = None
     try:
         # Create StressChaos with both CPU and memory stress
-        chaos_obj = chaos.create_stress_chaos(
+        chaos_obj = chaos_helper.create_stress_chaos(
             selector={"app": service},
             duration="60s",
             mode="one",
@@ -205,51 +200,66 @@ def test_combined_cpu_memory_stress(
         )
         chaos_name = chaos_obj["metadata"]["name"]
         
-        print(f"✓ Created StressChaos experiment: {chaos_name}")
-        print(f"✓ Applying combined stress (CPU: 50%, Memory: 128MB)")
+        log.info(f"✓ Created StressChaos experiment: {chaos_name}")
+        log.info(f"✓ Applying combined stress (CPU: 50%, Memory: 128MB)")
         
-        time.sleep(8)
+        if not chaos_helper.wait_until_phase("StressChaos", chaos_name):
+            log.warning(f"⚠️  {chaos_name} not confirmed injected within 15s")
         
         # Monitor service health over time
         path = f"/api/{service}/actuator/health"
         
-        print(f"✓ Monitoring service health over 30s...")
+        log.info(f"✓ Monitoring service health over 30s...")
         
-        checks = 0
-        successes = 0
         max_checks = 6
+        check_interval = 5
         
-        for i in range(max_checks):
+        def probe():
             try:
                 response = api_client.get(path, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     if data.get("status") == "UP":
-                        successes += 1
-                        print(f"  ✓ Check {i+1}/{max_checks}: healthy")
-                    else:
-                        print(f"  ✗ Check {i+1}/{max_checks}: unhealthy")
-                else:
-                    print(f"  ✗ Check {i+1}/{max_checks}: status {response.status_code}")
+                        return True, "healthy"
+                    return False, "unhealthy"
+                return False, f"status {response.status_code}"
             except Exception as e:
-                print(f"  ✗ Check {i+1}/{max_checks}: {e}")
-            
-            checks += 1
-            time.sleep(5)
+                return False, str(e)
+        
+        # Fire probes on a fixed schedule (0s, 5s, 10s, ...) so slow responses
+        # under stress neither delay later probes nor drift the sampling cadence
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max_checks) as executor:
+            futures = []
+            for i in range(max_checks):
+                time.sleep(max(0.0, start + i * check_interval - time.monotonic()))
+                futures.append(executor.submit(probe))
+            results = [f.result() for f in futures]
+        
+        checks = len(results)
+        successes = 0
+        for i, (healthy, detail) in enumerate(results):
+            if healthy:
+                successes += 1
+                log.info(f"  ✓ Check {i+1}/{max_checks}: {detail}")
+            else:
+                log.info(f"  ✗ Check {i+1}/{max_checks}: {detail}")
         
         # Service should be healthy at least 50% of the time
         success_rate = successes / checks if checks > 0 else 0
-        print(f"✓ Success rate: {success_rate:.0%} ({successes}/{checks})")
+        log.info(f"✓ Success rate: {success_rate:.0%} ({successes}/{checks})")
         
         assert success_rate >= 0.5, f"Service {service} success rate too low under stress: {success_rate:.0%}"
         
-        print(f"✅ Service {service} maintains {success_rate:.0%} availability under combined stress")
+        log.info(
+            f"✅ Service {service} maintains {success_rate:.0%} availability under combined stress"
+        )
         
     finally:
         if chaos_name:
             try:
-                chaos.delete_chaos("StressChaos", chaos_name)
-                print(f"✓ Cleaned up chaos experiment: {chaos_name}")
+                chaos_helper.delete_chaos("StressChaos", chaos_name)
+                log.info(f"✓ Cleaned up chaos experiment: {chaos_name}")
             except Exception as e:
-                print(f"⚠️  Failed to cleanup: {e}")
+                log.warning(f"⚠️  Failed to cleanup: {e}")
 
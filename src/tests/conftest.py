@@ -4,8 +4,6 @@ Pytest configuration and fixtures for system tests.
 
 import pytest
 
-from src.tests.helpers.api_client import APIClient
-
 
 def pytest_addoption(parser):
     """Add custom command-line options for pytest."""
@@ -22,6 +20,12 @@ def pytest_addoption(parser):
         default=60,
         help="Default timeout for HTTP requests in seconds",
     )
+    parser.addoption(
+        "--chaos-seed",
+        action="store",
+        default=None,
+        help="Seed mixed into each chaos test's target selection (default: fixed per test)",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -39,5 +43,10 @@ def timeout(request):
 @pytest.fixture(scope="session")
 def api_client(base_url, timeout):
     """Provide API client instance."""
-    return APIClient(base_url=base_url, timeout=timeout)
+    # Imported on first use so collection-only and load-only runs skip requests/urllib3
+    from src.tests.helpers.api_client import APIClient
+
+    client = APIClient(base_url=base_url, timeout=timeout)
+    yield client
+    client.close()
 
@@ -2,7 +2,8 @@
 API Client wrapper for making HTTP requests with retry logic, timeout, and error handling.
 """
 
-import time
+import random
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
@@ -10,15 +11,69 @@ from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
 
+class _JitteredRetry(Retry):
+    """Retry with capped exponential backoff and +/-50% jitter.
+
+    urllib3 < 2 (pinned for the kubernetes client) has no backoff_jitter or
+    backoff_max options, so both are applied here. Jitter keeps retrying
+    clients from hitting a recovering service in lockstep.
+    """
+
+    BACKOFF_CAP = 10.0
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(self.BACKOFF_CAP, backoff) * random.uniform(0.5, 1.5)
+
+
+@lru_cache(maxsize=None)
+def _build_retry(total: int, backoff_factor: float) -> Retry:
+    """Build the retry strategy used by APIClient sessions.
+
+    Cached per (total, backoff_factor): urllib3 never mutates a Retry in place
+    (increment() returns a new one), so clients with the same settings share one.
+    """
+    return _JitteredRetry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"}),
+        respect_retry_after_header=True,
+        # Hand back the last response so raise_for_status reports the real status
+        raise_on_status=False,
+    )
+
+
+def _check(response: requests.Response) -> None:
+    """Raise for 4xx/5xx responses; successful responses skip raise_for_status entirely."""
+    if response.status_code >= 400:
+        response.raise_for_status()
+
+
 class APIClient:
     """HTTP client with retry logic and consistent error handling."""
 
+    __slots__ = (
+        "base_url",
+        "timeout",
+        "session",
+        "_url_cache",
+        "_get",
+        "_post",
+        "_put",
+        "_delete",
+    )
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 60,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_connections: int = 32,
+        pool_maxsize: int = 64,
     ):
         """
         Initialize API client.
@@ -28,29 +83,46 @@ class APIClient:
             timeout: Default timeout in seconds for requests
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Backoff factor for retry delays
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections kept per host
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
 
+        # Full URLs by request path; tests hit the same few paths repeatedly
+        self._url_cache: Dict[str, str] = {}
+
         # Configure session with retry strategy
         self.session = requests.Session()
 
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-        )
+        retry_strategy = _build_retry(total=max_retries, backoff_factor=backoff_factor)
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep-alive pool so repeated probes (e.g. chaos monitoring loops) reuse connections;
+        # sized so concurrent probes never hit "Connection pool is full, discarding connection"
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Session verbs bound once, so each request skips the attribute lookups
+        self._get = self.session.get
+        self._post = self.session.post
+        self._put = self.session.put
+        self._delete = self.session.delete
+
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
-        if path.startswith("/"):
-            return f"{self.base_url}{path}"
-        return f"{self.base_url}/{path}"
+        url = self._url_cache.get(path)
+        if url is None:
+            if path.startswith("/"):
+                url = f"{self.base_url}{path}"
+            else:
+                url = f"{self.base_url}/{path}"
+            self._url_cache[path] = url
+        return url
 
     def get(
         self,
@@ -75,15 +147,14 @@ class APIClient:
             requests.RequestException: If request fails after retries
         """
         url = self._build_url(path)
-        timeout = timeout or self.timeout
 
-        response = self.session.get(
+        response = self._get(
             url,
             params=params,
             headers=headers,
-            timeout=timeout,
+            timeout=timeout or self.timeout,
         )
-        response.raise_for_status()
+        _check(response)
         return response
 
     def post(
@@ -111,16 +182,15 @@ class APIClient:
             requests.RequestException: If request fails after retries
         """
         url = self._build_url(path)
-        timeout = timeout or self.timeout
 
-        response = self.session.post(
+        response = self._post(
             url,
             json=json,
             data=data,
             headers=headers,
-            timeout=timeout,
+            timeout=timeout or self.timeout,
         )
-        response.raise_for_status()
+        _check(response)
         return response
 
     def put(
@@ -148,16 +218,15 @@ class APIClient:
             requests.RequestException: If request fails after retries
         """
         url = self._build_url(path)
-        timeout = timeout or self.timeout
 
-        response = self.session.put(
+        response = self._put(
             url,
             json=json,
             data=data,
             headers=headers,
-            timeout=timeout,
+            timeout=timeout or self.timeout,
         )
-        response.raise_for_status()
+        _check(response)
         return response
 
     def delete(
@@ -181,16 +250,19 @@ class APIClient:
             requests.RequestException: If request fails after retries
         """
         url = self._build_url(path)
-        timeout = timeout or self.timeout
 
-        response = self.session.delete(
+        response = self._delete(
             url,
             headers=headers,
-            timeout=timeout,
+            timeout=timeout or self.timeout,
         )
-        response.raise_for_status()
+        _check(response)
         return response
 
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+
     def health_check(self, path: str = "/actuator/health") -> Dict[str, Any]:
         """
         Perform health check.
@@ -205,5 +277,31 @@ class APIClient:
             requests.RequestException: If health check fails
         """
         response = self.get(path, timeout=10)
-        return response.json() if response.text else {}
+        # Test the raw bytes: .text would decode the whole body only to decode it again in json()
+        return response.json() if response.content else {}
+
+    def health_check_up(self, path: str = "/actuator/health") -> bool:
+        """
+        Check whether a health endpoint reports top-level status UP.
+
+        The common compact body is recognised by its prefix without parsing;
+        anything else falls back to a full JSON parse.
+
+        Args:
+            path: Health check path
+
+        Returns:
+            True if the top-level status is UP
+
+        Raises:
+            requests.RequestException: If health check fails
+        """
+        response = self.get(path, timeout=10)
+        raw = response.content
+        if raw.startswith(b'{"status":"UP"'):
+            return True
+        if not raw:
+            return False
+        data = response.json()
+        return isinstance(data, dict) and data.get("status") == "UP"
 
@@ -8,33 +8,48 @@ To add a new scenario:
 """
 
 import os
-from locust import HttpUser, task, between
+from locust import FastHttpUser, task, between
 
 from src.tests.load.scenarios.health import HealthCheckScenario
 
 
-class ShopifakeUser(HttpUser):
+class ShopifakeUser(FastHttpUser):
     """Main Locust user class that combines all scenarios.
     
+    Uses FastHttpUser (geventhttpclient) rather than the requests-based HttpUser,
+    so each load generator core sustains far more requests per second.
+    
     To add a new scenario, create it in scenarios/ and add a task method here.
     """
     
     wait_time = between(1, 3)  # Wait 1-3 seconds between requests
+    network_timeout = 10.0  # Seconds to wait for a response
+    connection_timeout = 10.0  # Seconds to wait for a connection
     
     def on_start(self):
         """Called when a user starts."""
         # Base URL is automatically set by Locust from --host parameter
         pass
     
-    @task(1)
+    @task(9)
     def health_checks(self):
-        """Health checks scenario (weight: 1).
+        """Health checks scenario (weight: 9).
         
         Simple load test on health endpoints.
         """
         scenario = HealthCheckScenario(self.client)
         scenario.run()
     
+    @task(1)
+    def aggregate_health_check(self):
+        """Aggregate health check scenario (weight: 1).
+        
+        One gateway request covering every service it reports on. Kept rare:
+        the gateway is already one of the endpoints health_checks samples.
+        """
+        scenario = HealthCheckScenario(self.client)
+        scenario.check_all()
+    
     # To add more scenarios:
     # @task(2)
     # def your_new_scenario(self):
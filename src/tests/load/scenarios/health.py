@@ -2,12 +2,19 @@
 Health checks scenario - simple load test on health endpoints.
 """
 
+import itertools
 import random
 
+# Healthy bodies as serialized by Spring Boot actuator and the FastAPI services,
+# which both emit the top-level status first
+_HEALTHY_BODY_PREFIXES = (b'{"status":"UP"', b'{"status":"healthy"')
+
 
 class HealthCheckScenario:
     """Simple scenario that performs health checks on services."""
     
+    __slots__ = ("client",)
+    
     # List of health check endpoints
     HEALTH_ENDPOINTS = [
         "/actuator/health",  # Gateway
@@ -25,18 +32,34 @@ class HealthCheckScenario:
         "/api/auth-b2e/healthz",
     ]
     
+    # Spring Boot services the gateway may report as components of its own health
+    SPRING_BOOT_SERVICES = (
+        "access",
+        "audit",
+        "catalog",
+        "customers",
+        "inventory",
+        "orders",
+        "pricing",
+        "sales-dashboard",
+        "sites",
+    )
+    
+    # Uniform endpoint picks drawn once at import and replayed in a ring, shared by all users
+    _endpoint_ring = itertools.cycle(random.choices(HEALTH_ENDPOINTS, k=4096))
+    
     def __init__(self, client):
         """Initialize scenario with HTTP client.
         
         Args:
-            client: Locust HttpUser client for making requests
+            client: Locust FastHttpUser client for making requests
         """
         self.client = client
     
     def run(self):
         """Execute health check scenario."""
-        # Randomly select a health endpoint to check
-        endpoint = random.choice(self.HEALTH_ENDPOINTS)
+        # Next pre-sampled random health endpoint
+        endpoint = next(HealthCheckScenario._endpoint_ring)
         self.check_health(endpoint)
     
     def check_health(self, endpoint: str):
@@ -51,20 +74,62 @@ class HealthCheckScenario:
             name=f"health {endpoint}",
         ) as response:
             if response.status_code == 200:
+                # Fast path: accept the common healthy body without parsing it. Only a
+                # prefix match is safe; nested components carry their own "status"
+                if (response.content or b"").startswith(_HEALTHY_BODY_PREFIXES):
+                    response.success()
+                    return
+                
                 # Try to parse JSON response if available
                 try:
                     data = response.json()
-                    # Check if status is UP or healthy (Python services use "healthy")
-                    if isinstance(data, dict) and "status" in data:
-                        if data["status"] in ["UP", "healthy"]:
-                            response.success()
-                        else:
-                            response.failure(f"Status not UP/healthy: {data.get('status')}")
-                    else:
-                        response.success()
-                except Exception:
-                    # If not JSON or parsing fails, still consider 200 as success
+                except ValueError:
+                    # If not JSON, still consider 200 as success
+                    response.success()
+                    return
+                
+                # Check if status is UP or healthy (Python services use "healthy");
+                # bodies without a status field count as success
+                status = data.get("status") if isinstance(data, dict) else None
+                if status is None or status in ("UP", "healthy"):
                     response.success()
+                else:
+                    response.failure(f"Status not UP/healthy: {status}")
             else:
                 response.failure(f"Health check failed: {response.status_code}")
-
+    
+    def check_all(self):
+        """Check all services in one request through the gateway's aggregated health.
+        
+        Only services the gateway reports as health components are checked
+        individually; run() still probes every endpoint on its own.
+        """
+        with self.client.get(
+            "/actuator/health",
+            catch_response=True,
+            name="health aggregate",
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f"Aggregate health check failed: {response.status_code}")
+                return
+            
+            try:
+                data = response.json()
+            except ValueError:
+                response.failure("Aggregate health response is not JSON")
+                return
+            
+            if not isinstance(data, dict) or data.get("status") != "UP":
+                response.failure(f"Gateway status not UP: {data}")
+                return
+            
+            components = data.get("components") or {}
+            down = [
+                service
+                for service in self.SPRING_BOOT_SERVICES
+                if service in components and components[service].get("status") != "UP"
+            ]
+            if down:
+                response.failure(f"Services not UP: {', '.join(down)}")
+            else:
+                response.success()
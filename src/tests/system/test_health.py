@@ -3,6 +3,8 @@ Health check tests for all Shopifake microservices.
 Tests services through the API Gateway.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 
@@ -30,6 +32,38 @@ AUTH_SERVICES = [
     "auth-b2e",
 ]
 
+# Every service health endpoint: (service, path, required "status" value or None for 200-only)
+SERVICE_HEALTH_CHECKS = (
+    [(service, f"/api/{service}/actuator/health", "UP") for service in SPRING_BOOT_SERVICES]
+    + [(service, f"/api/{service}/health", None) for service in PYTHON_SERVICES]
+    + [(service, f"/api/{service}/healthz", "UP") for service in AUTH_SERVICES]
+)
+
+
+def _probe_health(api_client, path, expected_status):
+    """
+    Probe one health endpoint.
+
+    Returns:
+        None if healthy, otherwise a description of the failure
+    """
+    try:
+        if expected_status is None:
+            response = api_client.get(path, timeout=10)
+            if response.status_code != 200:
+                return f"HTTP {response.status_code}: {response.text}"
+            return None
+        # Cheap check first; only fetch the full body for the failure message
+        if expected_status == "UP" and api_client.health_check_up(path):
+            return None
+        data = api_client.health_check(path)
+    except Exception as e:
+        return f"request failed: {e}"
+
+    if data.get("status") != expected_status:
+        return f"status {data.get('status')!r}, details: {data}"
+    return None
+
 
 def test_gateway_health(api_client):
     """Test that the API Gateway is healthy."""
@@ -37,6 +71,30 @@ def test_gateway_health(api_client):
     assert data.get("status") == "UP", f"Gateway status is not UP: {data}"
 
 
+def test_all_services_health_concurrent(api_client):
+    """
+    Test health of every microservice at once.
+
+    Probes run concurrently, so the sweep costs one round-trip instead of one per service.
+    """
+    with ThreadPoolExecutor(max_workers=len(SERVICE_HEALTH_CHECKS)) as executor:
+        results = executor.map(
+            lambda check: _probe_health(api_client, check[1], check[2]),
+            SERVICE_HEALTH_CHECKS,
+        )
+        failures = {
+            service: failure
+            for (service, _, _), failure in zip(SERVICE_HEALTH_CHECKS, results)
+            if failure
+        }
+
+    assert not failures, "Unhealthy services:\n" + "\n".join(
+        f"  {service}: {failure}" for service, failure in failures.items()
+    )
+
+
+# Per-service variants: same checks as above, one test each for granular reports
+@pytest.mark.slow
 @pytest.mark.parametrize("service", SPRING_BOOT_SERVICES)
 def test_spring_boot_service_health(api_client, service):
     """Test health of Spring Boot microservices through gateway."""
@@ -50,6 +108,7 @@ def test_spring_boot_service_health(api_client, service):
     )
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize("service", PYTHON_SERVICES)
 def test_python_service_health(api_client, service):
     """Test health of Python/FastAPI microservices through gateway."""
@@ -64,6 +123,7 @@ def test_python_service_health(api_client, service):
     )
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize("service", AUTH_SERVICES)
 def test_auth_service_health(api_client, service):
     """Test health of authentication services through gateway.